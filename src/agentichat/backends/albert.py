@@ -1,15 +1,161 @@
 """Backend Albert API (Etalab) pour agentichat."""
 
 import json
-from typing import AsyncIterator
+import logging
+import re
+from typing import Any, AsyncIterator, Iterator
 
 import aiohttp
 
+from ..utils.json_utils import JSONDecodeError, dumps, dumps_bytes, loads, simdjson
 from ..utils.logger import get_logger
-from .base import Backend, BackendError, ChatResponse, Message, TokenUsage, ToolCall
+from .base import (
+    Backend,
+    BackendError,
+    CallUsage,
+    ChatResponse,
+    Message,
+    TokenUsage,
+    ToolCall,
+    new_tool_call_id,
+)
 
 logger = get_logger("agentichat.backends.albert")
 
+# Décodeur partagé : raw_decode(texte, index) renvoie l'objet et sa position de fin
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE_RE = re.compile(r"\s*")
+
+# Marqueurs d'ouverture des formats textuels de tool calls (dispatch sur lastgroup).
+# Seule l'ouverture est reconnue par le regex (pas de .*? qui backtrack) ;
+# la fin de chaque format est cherchée ensuite à partir de cette position.
+_TOOL_CALL_ANCHOR_RE = re.compile(
+    r'(?P<named>\[TOOL_CALLS\](?P<named_tool>\w+)\s*\{)'
+    r'|(?P<function>\[TOOL_CALLS\]\{)'
+    r'|(?P<block>```json)'
+    r'|(?P<xml><tool_call>\s*<function=(?P<xml_tool>\w+)>)'
+)
+_XML_CLOSE_RE = re.compile(r'</function>\s*</tool_call>')
+_XML_PARAM_RE = re.compile(r'<parameter=(\w+)>(.*?)</parameter>', re.DOTALL)
+_DIRECT_JSON_RE = re.compile(r'\{[^{}]*"name"[^{}]*\{[^}]*\}[^{}]*\}')
+
+# Sous-chaînes dont au moins une est nécessaire pour qu'un des formats corresponde
+_TOOL_CALL_MARKERS = ("[TOOL_CALLS]", "<tool_call>", "```json", '"name"')
+
+# finish_reason pour lesquels on ne cherche pas de tool calls dans le texte
+_NO_EXTRACTION_FINISH_REASONS = frozenset({"length", "content_filter"})
+
+# Conversions ToolCall -> dict OpenAI, par id(tool_call) : les arguments sont
+# sérialisés en JSON, et l'historique est renvoyé en entier à chaque tour.
+# Chaque entrée garde une référence au tool call, dont l'id ne peut donc pas
+# être réutilisé tant qu'elle est en cache.
+_TOOL_CALL_CACHE_SIZE = 256
+_tool_call_cache: dict[int, tuple[ToolCall, dict]] = {}
+
+
+def _iter_json_values(text: str) -> Iterator[Any]:
+    """Décode successivement les valeurs JSON concaténées dans un texte.
+
+    Args:
+        text: Texte contenant une ou plusieurs valeurs JSON (séparées par des blancs)
+
+    Yields:
+        Chaque valeur décodée ; une valeur invalide est ignorée et le décodage
+        reprend à l'accolade ouvrante suivante
+    """
+    idx = _WHITESPACE_RE.match(text).end()
+    while idx < len(text):
+        try:
+            value, idx = _JSON_DECODER.raw_decode(text, idx)
+        except JSONDecodeError as e:
+            logger.debug(f"Failed to parse JSON block: {text[idx:idx + 100]}... Error: {e}")
+            idx = text.find("{", idx + 1)
+            if idx == -1:
+                return
+            continue
+        yield value
+        idx = _WHITESPACE_RE.match(text, idx).end()
+
+
+def _decode_body(body: bytes) -> Any:
+    """Décode le corps JSON d'une réponse Albert.
+
+    Args:
+        body: Corps brut de la réponse
+
+    Returns:
+        Document JSON décodé
+
+    Raises:
+        BackendError: Si le corps n'est pas du JSON valide (ex: page HTML d'un proxy)
+    """
+    try:
+        return loads(body)
+    except ValueError as e:  # JSONDecodeError (json ou orjson), UnicodeDecodeError
+        raise BackendError(
+            f"Invalid JSON response from Albert: {e}",
+            error_type=BackendError.SERVER_ERROR,
+        ) from e
+
+
+def _tool_call_to_dict(tc: ToolCall) -> dict:
+    """Convertit un ToolCall au format OpenAI, avec cache par tool call.
+
+    ToolCall est figé et ses arguments sont traités comme immuables (ils ne
+    doivent pas être modifiés en place) : une entrée reste valide tant qu'elle
+    est en cache.
+
+    Args:
+        tc: Tool call à convertir
+
+    Returns:
+        Dict du tool call (arguments sérialisés en chaîne JSON)
+    """
+    key = id(tc)
+    entry = _tool_call_cache.get(key)
+    if entry is not None:
+        return entry[1]
+
+    tool_call_dict = {
+        "id": tc.id,
+        "type": "function",
+        "function": {
+            "name": tc.name,
+            "arguments": dumps(tc.arguments),
+        },
+    }
+
+    if key not in _tool_call_cache and len(_tool_call_cache) >= _TOOL_CALL_CACHE_SIZE:
+        del _tool_call_cache[next(iter(_tool_call_cache))]  # Éviction du plus ancien
+    _tool_call_cache[key] = (tc, tool_call_dict)
+    return tool_call_dict
+
+
+def _message_to_dict(msg: Message) -> dict:
+    """Convertit un Message au format OpenAI/Albert.
+
+    Args:
+        msg: Message à convertir
+
+    Returns:
+        Dict prêt à être sérialisé dans le payload
+    """
+    # Cas courant (user/assistant/system sans tools) : dict à 2 clés
+    if not msg.tool_calls and not msg.tool_call_id:
+        return {"role": msg.role, "content": msg.content}
+
+    message_dict = {"role": msg.role, "content": msg.content}
+
+    # Convertir les tool_calls (objets ToolCall) en format OpenAI
+    if msg.tool_calls:
+        message_dict["tool_calls"] = [_tool_call_to_dict(tc) for tc in msg.tool_calls]
+
+    # Ajouter tool_call_id si présent (pour réponses de tools)
+    if msg.tool_call_id:
+        message_dict["tool_call_id"] = msg.tool_call_id
+
+    return message_dict
+
 
 class AlbertBackend(Backend):
     """Backend pour l'API Albert (OpenGateLLM) d'Etalab.
@@ -33,8 +179,16 @@ class AlbertBackend(Backend):
             **kwargs: Paramètres supplémentaires (temperature, max_tokens, etc.)
         """
         super().__init__(*args, **kwargs)
-        self.last_usage: dict | None = None
         self._session: aiohttp.ClientSession | None = None  # Session HTTP persistante
+        # Timeouts HTTP construits une fois et réutilisés à chaque requête
+        self._default_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._list_timeout = aiohttp.ClientTimeout(total=10)
+        self._health_timeout = aiohttp.ClientTimeout(total=5)
+        # Headers HTTP mis en cache (voir _get_headers)
+        self._headers: dict[str, str] = {}
+        self._headers_key: str | None = None
+        # Parser simdjson réutilisé entre les chunks de streaming (optionnel)
+        self._sj_parser = simdjson.Parser() if simdjson is not None else None
 
         # Vérifier que l'API key est présente
         if not self.api_key:
@@ -57,227 +211,154 @@ class AlbertBackend(Backend):
         Returns:
             Liste de ToolCall ou None si aucun trouvé
         """
-        import re
-        import uuid
+        # Cas courant : réponse texte sans aucun marqueur de tool call
+        if not any(marker in content for marker in _TOOL_CALL_MARKERS):
+            return None
 
         tool_calls = []
+        xml_calls = 0  # Le format 3 ne sert que si seuls des appels XML ont été trouvés
+
+        # Une seule passe sur le texte pour les formats 1, 5, 2 et 4
+        # Le regex ne reconnaît que les marqueurs d'ouverture ; la fin de chaque
+        # appel est trouvée par raw_decode / str.find, puis la recherche reprend
+        # après l'appel consommé : le texte n'est parcouru qu'une fois.
+        pos = 0
+        while (match := _TOOL_CALL_ANCHOR_RE.search(content, pos)) is not None:
+            kind = match.lastgroup
+            pos = match.end()
+
+            if kind == "named":
+                # Format 1: [TOOL_CALLS]tool_name{...args...}
+                tool_name = match.group("named_tool")
+                start_pos = match.end() - 1  # Position du '{'
+
+                # raw_decode trouve la fin de l'objet JSON (scanner en C)
+                try:
+                    arguments, pos = _JSON_DECODER.raw_decode(content, start_pos)
+                    tool_call = ToolCall(
+                        id=new_tool_call_id(),
+                        name=tool_name,
+                        arguments=arguments if isinstance(arguments, dict) else {},
+                    )
+                    tool_calls.append(tool_call)
+                    logger.info(f"Extracted tool call from [TOOL_CALLS] format: {tool_name}")
+                except JSONDecodeError as e:
+                    logger.debug(f"Failed to parse [TOOL_CALLS] arguments: {content[start_pos:start_pos + 100]}... Error: {e}")
 
-        # Format 1: [TOOL_CALLS]tool_name{...args...}
-        # Chercher tous les [TOOL_CALLS]tool_name dans le texte
-        pattern = r'\[TOOL_CALLS\](\w+)\s*(\{)'
-        matches = re.finditer(pattern, content)
-
-        for match in matches:
-            tool_name = match.group(1)
-            start_pos = match.end() - 1  # Position du '{'
-
-            # Compter les accolades pour trouver la fin du JSON
-            brace_count = 0
-            end_pos = start_pos
-            in_string = False
-            escape_next = False
+            elif kind == "function":
+                # Format 5: [TOOL_CALLS]{"function": "tool_name", ...args au même niveau...}
+                # Nouveau format où le JSON contient directement "function" pour le nom
+                start_pos = match.end() - 1  # Position du '{'
 
-            for i in range(start_pos, len(content)):
-                char = content[i]
+                try:
+                    data, pos = _JSON_DECODER.raw_decode(content, start_pos)
+                    if isinstance(data, dict) and "function" in data:
+                        tool_name = data.pop("function")  # Retirer "function" du dict
+                        # Les autres clés sont les arguments
+                        arguments = data
 
-                # Gérer les échappements dans les strings
-                if escape_next:
-                    escape_next = False
+                        tool_call = ToolCall(
+                            id=new_tool_call_id(),
+                            name=tool_name,
+                            arguments=arguments,
+                        )
+                        tool_calls.append(tool_call)
+                        logger.info(f"Extracted tool call from [TOOL_CALLS]{{function:...}} format: {tool_name}")
+                except JSONDecodeError as e:
+                    logger.debug(f"Failed to parse [TOOL_CALLS]{{function:...}} format: {content[start_pos:start_pos + 100]}... Error: {e}")
+
+            elif kind == "block":
+                # Format 2: Blocs ```json ... ``` avec name et arguments/parameters
+                # Un bloc peut contenir plusieurs objets JSON à la suite
+                block_end = content.find("```", pos)
+                if block_end == -1:
                     continue
+                block_body = content[pos:block_end].strip()
+                pos = block_end + 3
 
-                if char == '\\':
-                    escape_next = True
-                    continue
+                for data in _iter_json_values(block_body):
+                    if isinstance(data, dict) and "name" in data:
+                        # Supporter "arguments" et "parameters"
+                        arguments = data.get("arguments") or data.get("parameters") or {}
+                        if not isinstance(arguments, dict):
+                            arguments = {}
 
-                # Gérer les guillemets (entrée/sortie de string)
-                if char == '"' and not escape_next:
-                    in_string = not in_string
+                        tool_call = ToolCall(
+                            id=new_tool_call_id(),
+                            name=data["name"],
+                            arguments=arguments,
+                        )
+                        tool_calls.append(tool_call)
+                        logger.info(f"Extracted tool call from JSON block: {data['name']}")
+
+            elif kind == "xml":
+                # Format 4: Format XML de Qwen3 - <tool_call><function=...><parameter=...>
+                # Exemple: <tool_call><function=list_files><parameter=path>.</parameter></function></tool_call>
+                tool_name = match.group("xml_tool")
+                xml_end = _XML_CLOSE_RE.search(content, pos)
+                if xml_end is None:
                     continue
+                params_block = content[pos:xml_end.start()]
+                pos = xml_end.end()
 
-                # Compter les accolades seulement hors des strings
-                if not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
+                # Parser les paramètres - format: <parameter=name>value</parameter>
+                arguments = {
+                    param_match.group(1): param_match.group(2).strip()
+                    for param_match in _XML_PARAM_RE.finditer(params_block)
+                }
 
-                        # JSON complet trouvé
-                        if brace_count == 0:
-                            end_pos = i + 1
-                            break
-
-            # Extraire le JSON
-            json_str = content[start_pos:end_pos]
-
-            try:
-                arguments = json.loads(json_str)
                 tool_call = ToolCall(
-                    id=str(uuid.uuid4()),
+                    id=new_tool_call_id(),
                     name=tool_name,
-                    arguments=arguments if isinstance(arguments, dict) else {},
+                    arguments=arguments,
                 )
                 tool_calls.append(tool_call)
-                logger.info(f"Extracted tool call from [TOOL_CALLS] format: {tool_name}")
-            except json.JSONDecodeError as e:
-                logger.debug(f"Failed to parse [TOOL_CALLS] arguments: {json_str[:100]}... Error: {e}")
-                continue
-
-        # Format 5: [TOOL_CALLS]{"function": "tool_name", ...args au même niveau...}
-        # Nouveau format où le JSON contient directement "function" pour le nom
-        pattern_func = r'\[TOOL_CALLS\](\{)'
-        matches_func = re.finditer(pattern_func, content)
-
-        for match in matches_func:
-            start_pos = match.end() - 1  # Position du '{'
-
-            # Compter les accolades pour trouver la fin du JSON
-            brace_count = 0
-            end_pos = start_pos
-            in_string = False
-            escape_next = False
-
-            for i in range(start_pos, len(content)):
-                char = content[i]
-
-                if escape_next:
-                    escape_next = False
-                    continue
-
-                if char == '\\':
-                    escape_next = True
-                    continue
-
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-
-                        if brace_count == 0:
-                            end_pos = i + 1
-                            break
-
-            # Extraire le JSON
-            json_str = content[start_pos:end_pos]
-
-            try:
-                data = json.loads(json_str)
-                if isinstance(data, dict) and "function" in data:
-                    tool_name = data.pop("function")  # Retirer "function" du dict
-                    # Les autres clés sont les arguments
-                    arguments = data
-
-                    tool_call = ToolCall(
-                        id=str(uuid.uuid4()),
-                        name=tool_name,
-                        arguments=arguments,
-                    )
-                    tool_calls.append(tool_call)
-                    logger.info(f"Extracted tool call from [TOOL_CALLS]{{function:...}} format: {tool_name}")
-            except json.JSONDecodeError as e:
-                logger.debug(f"Failed to parse [TOOL_CALLS]{{function:...}} format: {json_str[:100]}... Error: {e}")
-                continue
-
-        # Format 2: Blocs ```json ... ``` avec name et arguments/parameters
-        json_code_blocks = re.findall(r'```json\s*(.+?)\s*```', content, re.DOTALL)
-
-        for block in json_code_blocks:
-            lines = block.strip().split('\n')
-            current_obj = ""
-            brace_count = 0
-
-            for line in lines:
-                stripped = line.strip()
-                if not stripped:
-                    continue
-
-                current_obj += line + "\n"
-                brace_count += line.count('{') - line.count('}')
-
-                if brace_count == 0 and current_obj.strip():
-                    try:
-                        data = json.loads(current_obj.strip())
-                        if isinstance(data, dict) and "name" in data:
-                            # Supporter "arguments" et "parameters"
-                            arguments = data.get("arguments") or data.get("parameters") or {}
-                            if not isinstance(arguments, dict):
-                                arguments = {}
-
-                            tool_call = ToolCall(
-                                id=str(uuid.uuid4()),
-                                name=data["name"],
-                                arguments=arguments,
-                            )
-                            tool_calls.append(tool_call)
-                            logger.info(f"Extracted tool call from JSON block: {data['name']}")
-                    except json.JSONDecodeError as e:
-                        logger.debug(f"Failed to parse JSON block: {current_obj[:100]}... Error: {e}")
-
-                    current_obj = ""
+                xml_calls += 1
+                logger.info(f"Extracted tool call from XML format (Qwen3): {tool_name}")
 
         # Format 3: JSON direct dans le texte (sans blocs markdown)
         # Chercher tous les objets avec "name" et des paramètres
-        if not tool_calls:
-            potential_jsons = re.findall(r'\{[^{}]*"name"[^{}]*\{[^}]*\}[^{}]*\}', content)
-            for json_str in potential_jsons:
+        if len(tool_calls) == xml_calls:
+            for json_str in _DIRECT_JSON_RE.findall(content):
                 try:
-                    data = json.loads(json_str)
+                    data = loads(json_str)
                     if isinstance(data, dict) and "name" in data:
                         arguments = data.get("arguments") or data.get("parameters") or {}
                         if not isinstance(arguments, dict):
                             arguments = {}
 
                         tool_call = ToolCall(
-                            id=str(uuid.uuid4()),
+                            id=new_tool_call_id(),
                             name=data["name"],
                             arguments=arguments,
                         )
                         tool_calls.append(tool_call)
                         logger.info(f"Extracted tool call from direct JSON: {data['name']}")
-                except json.JSONDecodeError as e:
+                except JSONDecodeError as e:
                     logger.debug(f"Failed to parse direct JSON: {json_str[:100]}... Error: {e}")
 
-        # Format 4: Format XML de Qwen3 - <tool_call><function=...><parameter=...>
-        # Exemple: <tool_call><function=list_files><parameter=path>.</parameter></function></tool_call>
-        xml_pattern = r'<tool_call>\s*<function=(\w+)>(.*?)</function>\s*</tool_call>'
-        xml_matches = re.finditer(xml_pattern, content, re.DOTALL)
-
-        for match in xml_matches:
-            tool_name = match.group(1)
-            params_block = match.group(2)
-
-            # Parser les paramètres - format: <parameter=name>value</parameter>
-            arguments = {}
-            param_pattern = r'<parameter=(\w+)>(.*?)</parameter>'
-            param_matches = re.finditer(param_pattern, params_block, re.DOTALL)
-
-            for param_match in param_matches:
-                param_name = param_match.group(1)
-                param_value = param_match.group(2).strip()
-                arguments[param_name] = param_value
-
-            tool_call = ToolCall(
-                id=str(uuid.uuid4()),
-                name=tool_name,
-                arguments=arguments,
-            )
-            tool_calls.append(tool_call)
-            logger.info(f"Extracted tool call from XML format (Qwen3): {tool_name}")
-
         return tool_calls if tool_calls else None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Retourne la session HTTP persistante, en en créant une si nécessaire.
 
+        Le connecteur garde les connexions TCP/TLS ouvertes (keep-alive) et met
+        en cache la résolution DNS, ce qui évite une poignée de main par requête.
+
         Returns:
             Session aiohttp réutilisable entre les appels API.
         """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.connector_limit_per_host,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._default_timeout,
+            )
         return self._session
 
     async def close(self) -> None:
@@ -317,13 +398,19 @@ class AlbertBackend(Backend):
     def _get_headers(self) -> dict[str, str]:
         """Retourne les headers HTTP avec authentification.
 
+        Le dict est construit une fois puis réutilisé ; il est reconstruit si
+        l'API key change.
+
         Returns:
             Headers avec Bearer token
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        if self._headers_key != self.api_key:
+            self._headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+            self._headers_key = self.api_key
+        return self._headers
 
     async def chat(
         self,
@@ -348,32 +435,7 @@ class AlbertBackend(Backend):
         endpoint = f"{self.url}/v1/chat/completions"
 
         # Convertir les messages au format OpenAI/Albert
-        albert_messages = []
-        for msg in messages:
-            message_dict = {
-                "role": msg.role,
-                "content": msg.content,
-            }
-
-            # Convertir les tool_calls (objets ToolCall) en format OpenAI
-            if msg.tool_calls:
-                message_dict["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
-
-            # Ajouter tool_call_id si présent (pour réponses de tools)
-            if msg.tool_call_id:
-                message_dict["tool_call_id"] = msg.tool_call_id
-
-            albert_messages.append(message_dict)
+        albert_messages = [_message_to_dict(msg) for msg in messages]
 
         # Construire la requête
         payload = {
@@ -389,17 +451,23 @@ class AlbertBackend(Backend):
         if tools:
             payload["tools"] = tools
             logger.debug(f"Sending request with {len(tools)} tools")
-            logger.debug(f"Tools payload: {json.dumps(tools, indent=2)}")
+            # json.dumps(indent=2) coûte cher : ne le faire que si DEBUG est actif
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Tools payload: {json.dumps(tools, indent=2)}")
 
         logger.debug(
             f"Albert request: model={self.model}, messages={len(messages)}, "
             f"stream={stream}, timeout={self.timeout}s"
         )
 
+        # Sérialiser le payload une seule fois (réutilisé tel quel par les retries).
+        # Les arguments des tool calls restent une chaîne JSON (format OpenAI).
+        body = dumps_bytes(payload)
+
         if stream:
             # Pour le streaming, on doit garder la session ouverte (pas de retry)
             logger.debug("Starting streaming chat")
-            return self._stream_chat(endpoint, payload)
+            return self._stream_chat(endpoint, body)
 
         # Pour le non-streaming : retry automatique sur erreurs transitoires
         logger.debug("Starting non-streaming chat")
@@ -407,11 +475,11 @@ class AlbertBackend(Backend):
         async def _do_request():
             try:
                 session = await self._get_session()
-                async with session.post(
+                async with self._request_semaphore, session.post(
                     endpoint,
-                    json=payload,
+                    data=body,
                     headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    timeout=self._default_timeout,
                 ) as response:
                     if response.status != 200:
                         error_text = await response.text()
@@ -434,22 +502,22 @@ class AlbertBackend(Backend):
 
         return await self._retry_on_error(_do_request)
 
-    async def _stream_chat(self, endpoint: str, payload: dict) -> AsyncIterator[str]:
+    async def _stream_chat(self, endpoint: str, body: bytes) -> AsyncIterator[str]:
         """Stream la réponse d'Albert avec session HTTP maintenue.
 
         Args:
             endpoint: URL de l'endpoint
-            payload: Données à envoyer
+            body: Payload JSON déjà sérialisé
 
         Yields:
             Chunks de texte au fur et à mesure
         """
         session = await self._get_session()
-        async with session.post(
+        async with self._request_semaphore, session.post(
             endpoint,
-            json=payload,
+            data=body,
             headers=self._get_headers(),
-            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            timeout=self._default_timeout,
         ) as response:
             if response.status != 200:
                 error_text = await response.text()
@@ -459,30 +527,80 @@ class AlbertBackend(Backend):
                     error_type=self._categorize_http_error(response.status, error_text),
                 )
 
-            # Lire ligne par ligne (format SSE)
-                async for line in response.content:
-                    if not line:
-                        continue
+            # Les parsers JSON acceptent des bytes, inutile de décoder chaque ligne
+            async for data in self._iter_sse_data(response):
+                # Fin du stream
+                if data == b"[DONE]":
+                    break
+
+                content = self._extract_delta_content(data)
+                if content:
+                    yield content
+
+    @staticmethod
+    async def _iter_sse_data(response: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+        """Découpe un flux SSE en événements et renvoie leurs champs "data:".
+
+        Le flux est lu par blocs (iter_any) et découpé sur la ligne vide qui
+        termine chaque événement, plutôt que ligne par ligne. Les fins de ligne
+        CRLF et CR (autorisées par la spec SSE) sont normalisées en LF.
 
-                    line_str = line.decode("utf-8").strip()
+        Args:
+            response: Réponse HTTP en streaming
 
+        Yields:
+            Contenu brut de chaque ligne "data: ..." (sans le préfixe)
+        """
+        buffer = bytearray()
+        pending_cr = False  # "\r" en fin de bloc : peut-être suivi d'un "\n"
+        async for chunk in response.content.iter_any():
+            if pending_cr:
+                chunk = b"\r" + chunk
+            pending_cr = chunk.endswith(b"\r")
+            if pending_cr:
+                chunk = chunk[:-1]
+            buffer.extend(chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+            while (end := buffer.find(b"\n\n")) != -1:
+                event = bytes(buffer[:end])
+                del buffer[:end + 2]
+                for line in event.split(b"\n"):
                     # Format SSE: "data: {...}"
-                    if line_str.startswith("data: "):
-                        data_str = line_str[6:]  # Enlever "data: "
-
-                        # Fin du stream
-                        if data_str == "[DONE]":
-                            break
-
-                        try:
-                            data = json.loads(data_str)
-                            if "choices" in data and len(data["choices"]) > 0:
-                                delta = data["choices"][0].get("delta", {})
-                                content = delta.get("content", "")
-                                if content:
-                                    yield content
-                        except json.JSONDecodeError:
-                            continue
+                    if line.startswith(b"data: "):
+                        yield line[6:].rstrip()
+
+        # Dernier événement éventuel sans ligne vide finale
+        if pending_cr:
+            buffer.extend(b"\n")
+        for line in bytes(buffer).split(b"\n"):
+            if line.startswith(b"data: "):
+                yield line[6:].rstrip()
+
+    def _extract_delta_content(self, data: str | bytes) -> str:
+        """Extrait le texte incrémental d'un événement SSE de streaming.
+
+        Utilise le parser simdjson réutilisable si disponible (seul le champ
+        ``choices[0].delta.content`` est matérialisé), sinon le parser JSON
+        par défaut.
+
+        Args:
+            data: Contenu JSON de l'événement (après "data: ")
+
+        Returns:
+            Texte du delta, ou chaîne vide si absent ou invalide
+        """
+        if self._sj_parser is not None:
+            try:
+                return self._sj_parser.parse(data).at_pointer("/choices/0/delta/content") or ""
+            except (KeyError, IndexError, TypeError, ValueError):
+                return ""
+
+        try:
+            chunk = loads(data)
+        except JSONDecodeError:
+            return ""
+        if chunk.get("choices"):
+            return chunk["choices"][0].get("delta", {}).get("content") or ""
+        return ""
 
     async def _parse_response(self, response: aiohttp.ClientResponse) -> ChatResponse:
         """Parse la réponse complète d'Albert.
@@ -492,41 +610,52 @@ class AlbertBackend(Backend):
 
         Returns:
             ChatResponse avec le contenu et éventuels tool calls
+        
+        Raises:
+            BackendError: Si le corps n'est pas du JSON valide
         """
-        data = await response.json()
-        logger.debug(f"Albert response data: {json.dumps(data, indent=2)}")
-
-        if "choices" not in data or len(data["choices"]) == 0:
-            raise BackendError("Invalid response format from Albert API")
+        # Bytes bruts directement au parser JSON (pas de décodage str intermédiaire)
+        data = _decode_body(await response.read())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Albert response data: {json.dumps(data, indent=2)}")
 
-        choice = data["choices"][0]
-        message = choice.get("message", {})
-        content = message.get("content", "")
-
-        # Parser les tool calls si présents (format OpenAI)
+        # Réponse au format OpenAI : accès direct, une seule garde pour un format invalide
         tool_calls = None
-        if "tool_calls" in message and message["tool_calls"]:
-            tool_calls = []
-            for tc in message["tool_calls"]:
-                func = tc.get("function", {})
-                args_str = func.get("arguments", "{}")
-
-                # Parser les arguments JSON
-                try:
-                    arguments = json.loads(args_str) if isinstance(args_str, str) else args_str
-                except json.JSONDecodeError:
-                    arguments = {}
-
-                tool_calls.append(
-                    ToolCall(
-                        id=tc.get("id", ""),
-                        name=func.get("name", ""),
-                        arguments=arguments,
+        try:
+            choice = data["choices"][0]
+            message = choice["message"]
+            content = message.get("content") or ""
+
+            # Parser les tool calls si présents (format OpenAI)
+            raw_tool_calls = message.get("tool_calls")
+            if raw_tool_calls:
+                tool_calls = []
+                for tc in raw_tool_calls:
+                    func = tc["function"]
+                    args_str = func.get("arguments") or "{}"
+
+                    # Parser les arguments JSON
+                    try:
+                        arguments = loads(args_str) if isinstance(args_str, str) else args_str
+                    except JSONDecodeError:
+                        arguments = {}
+
+                    tool_calls.append(
+                        ToolCall(
+                            id=tc.get("id") or "",
+                            name=func["name"],
+                            arguments=arguments,
+                        )
                     )
-                )
+        except (KeyError, IndexError, TypeError) as e:
+            raise BackendError("Invalid response format from Albert API") from e
+
+        # Raison de fin annoncée par l'API (lue avant le fallback d'extraction)
+        finish_reason = choice.get("finish_reason") or "stop"
 
         # Si aucun tool call natif trouvé, essayer d'en extraire du texte
-        if not tool_calls and content:
+        # (inutile sur une réponse tronquée ou filtrée : le JSON serait incomplet)
+        if not tool_calls and content and finish_reason not in _NO_EXTRACTION_FINISH_REASONS:
             extracted_calls = self._extract_tool_calls_from_text(content)
             if extracted_calls:
                 tool_calls = extracted_calls
@@ -534,18 +663,15 @@ class AlbertBackend(Backend):
 
         # Limiter le nombre de tool calls si nécessaire
         tool_calls = self._limit_tool_calls(tool_calls)
-        if tool_calls and self.max_parallel_tools and len(tool_calls) == self.max_parallel_tools:
-            logger.info(f"Limited tool calls to {self.max_parallel_tools} (max_parallel_tools setting)")
 
         # Déterminer la raison de fin
-        finish_reason = choice.get("finish_reason", "stop")
         if tool_calls:
             finish_reason = "tool_calls"
 
         # Extraire les statistiques de tokens
         usage = None
-        if "usage" in data:
-            usage_data = data["usage"]
+        usage_data = data.get("usage")
+        if usage_data:
             usage = TokenUsage(
                 prompt_tokens=usage_data.get("prompt_tokens", 0),
                 completion_tokens=usage_data.get("completion_tokens", 0),
@@ -554,11 +680,11 @@ class AlbertBackend(Backend):
 
         # Stocker les statistiques pour affichage
         if usage:
-            self.last_usage = {
-                "prompt_tokens": usage.prompt_tokens,
-                "completion_tokens": usage.completion_tokens,
-                "total_tokens": usage.total_tokens,
-            }
+            self.last_usage = CallUsage(
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                total_tokens=usage.total_tokens,
+            )
             # Accumuler dans le compteur cumulatif
             self._accumulate_usage(usage.prompt_tokens, usage.completion_tokens)
 
@@ -585,7 +711,7 @@ class AlbertBackend(Backend):
             async with session.get(
                 endpoint,
                 headers=self._get_headers(),
-                timeout=aiohttp.ClientTimeout(total=10),
+                timeout=self._list_timeout,
             ) as response:
                 if response.status != 200:
                     error_text = await response.text()
@@ -595,7 +721,7 @@ class AlbertBackend(Backend):
                         error_type=self._categorize_http_error(response.status, error_text),
                     )
 
-                data = await response.json()
+                data = _decode_body(await response.read())
                 models = data.get("data", [])
                 return [model["id"] for model in models]
 
@@ -614,12 +740,12 @@ class AlbertBackend(Backend):
         endpoint = f"{self.url}/health"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint,
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as response:
-                    return response.status == 200
+            session = await self._get_session()
+            async with session.get(
+                endpoint,
+                timeout=self._health_timeout,
+            ) as response:
+                return response.status == 200
         except aiohttp.ClientError:
             return False
 
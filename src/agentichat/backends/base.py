@@ -3,33 +3,147 @@
 import asyncio
 import json
 import logging
+import os
+import random
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import AsyncIterator, Callable, Literal
+from dataclasses import dataclass, fields
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal
+
+try:
+    import tiktoken
+except ImportError:  # Dépendance optionnelle (extra "perf")
+    tiktoken = None
 
 logger = logging.getLogger(__name__)
 
+# Nombre max de messages dont l'estimation de tokens est mise en cache
+_MESSAGE_TOKENS_CACHE_SIZE = 4096
+# Nombre max de tool calls dont le compte de tokens des arguments est mis en cache
+_TOOL_CALL_CACHE_SIZE = 1024
+_encoding = None  # Encodage tiktoken, chargé par load_token_encoding()
+_encoding_failed = False  # True si tiktoken est indisponible (import ou chargement)
+
+
+def load_token_encoding() -> bool:
+    """Charge l'encodage tiktoken partagé utilisé par count_tokens.
+
+    Bloquant (le fichier BPE peut être téléchargé au premier chargement) : à
+    lancer dans un thread au démarrage. count_tokens ne le charge jamais
+    lui-même et reste sur l'heuristique tant qu'il n'est pas chargé.
+
+    Returns:
+        True si l'encodage est disponible
+    """
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        if tiktoken is None:
+            _encoding_failed = True
+        else:
+            try:
+                _encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:  # ex: fichier BPE non téléchargeable hors ligne
+                logger.warning(f"tiktoken indisponible, estimation heuristique: {e}")
+                _encoding_failed = True
+    return _encoding is not None
+
+
+def count_tokens(text: str) -> int:
+    """Compte (ou estime) le nombre de tokens d'un texte.
+
+    L'heuristique ~3 caractères par token (marge de sécurité vs la moyenne de
+    4) sert de plancher. Si l'encodage tiktoken est chargé, le compte
+    cl100k_base est retenu quand il est plus élevé : les modèles servis (Qwen,
+    Mistral...) ont leur propre tokenizer, cl100k n'en est qu'une approximation.
+
+    Args:
+        text: Texte à mesurer
+
+    Returns:
+        Nombre de tokens
+    """
+    estimate = len(text) // 3
+    encoding = _encoding
+    if encoding is None:
+        return estimate
+    return max(len(encoding.encode(text, disallowed_special=())), estimate)
+
+
+def new_tool_call_id() -> str:
+    """Génère un identifiant de tool call pour les appels extraits du texte.
+
+    Ces IDs sont internes (seule l'unicité compte) : 8 octets aléatoires en
+    hexadécimal suffisent et coûtent moins cher qu'un uuid4 formaté.
+
+    Returns:
+        Identifiant hexadécimal de 16 caractères
+    """
+    return os.urandom(8).hex()
+
+
+def _setstate_compat(obj: object, state: list | dict | tuple) -> None:
+    """Restaure l'état d'une dataclass figée à __slots__ depuis un pickle.
 
-@dataclass
+    Accepte le format des dataclasses figées (liste des valeurs des champs),
+    celui des objets à __slots__ non figés (tuple ``(dict, slots)``) ainsi que
+    l'ancien format à ``__dict__``, pour relire les conversations sauvegardées
+    par les versions précédentes.
+
+    Args:
+        obj: Instance à restaurer
+        state: État picklé
+    """
+    if isinstance(state, list):
+        state = {f.name: value for f, value in zip(fields(obj), state)}
+    elif isinstance(state, tuple):
+        dict_state, slots_state = state
+        state = {**(dict_state or {}), **(slots_state or {})}
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
+
+
+@dataclass(slots=True, frozen=True)
 class Message:
-    """Message dans une conversation."""
+    """Message dans une conversation.
+
+    content est toujours une str : None (réponse ne contenant que des tool
+    calls, anciennes sauvegardes) est converti en "" à la construction comme
+    à la relecture d'un pickle.
+
+    Un message est immuable une fois construit (tool_calls compris) : les
+    backends mettent en cache ses conversions et estimations par instance.
+    """
 
     role: Literal["system", "user", "assistant", "tool"]
     content: str
     tool_calls: list["ToolCall"] | None = None
     tool_call_id: str | None = None
 
+    def __post_init__(self) -> None:
+        """Normalise content (None → "")."""
+        if self.content is None:
+            object.__setattr__(self, "content", "")
+
+    def __setstate__(self, state: list | dict | tuple) -> None:
+        """Restaure un message picklé (voir _setstate_compat) en normalisant content."""
+        _setstate_compat(self, state)
+        self.__post_init__()
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
-    """Appel de tool par le LLM."""
+    """Appel de tool par le LLM.
+
+    Immuable comme Message : arguments ne doit pas être modifié en place.
+    """
 
     id: str
     name: str
     arguments: dict
 
+    __setstate__ = _setstate_compat
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenUsage:
     """Statistiques d'utilisation de tokens."""
 
@@ -38,7 +152,31 @@ class TokenUsage:
     total_tokens: int = 0  # Total
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class CallUsage:
+    """Statistiques du dernier appel API (affichées par le spinner)."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    # Durées mesurées par le serveur, en ms (Ollama uniquement, 0 sinon)
+    prompt_eval_duration_ms: float = 0.0
+    eval_duration_ms: float = 0.0
+    total_duration_ms: float = 0.0
+    load_duration_ms: float = 0.0
+
+
+@dataclass(slots=True)
+class CumulativeUsage:
+    """Compteurs de tokens cumulés sur une requête (plusieurs appels API)."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    api_calls: int = 0  # Nombre d'appels API
+
+
+@dataclass(slots=True, frozen=True)
 class ChatResponse:
     """Réponse du LLM."""
 
@@ -67,24 +205,28 @@ class Backend(ABC):
         self.api_key = kwargs.get("api_key")
         self.max_parallel_tools = kwargs.get("max_parallel_tools")  # None = illimité
         self.context_max_tokens = kwargs.get("context_max_tokens")  # None = pas de limite
+        # Limites du pool de connexions HTTP (aiohttp plafonne à 100 / 30 par défaut,
+        # ce qui met en file d'attente les requêtes concurrentes)
+        self.connector_limit = kwargs.get("connector_limit", 1024)
+        self.connector_limit_per_host = kwargs.get("connector_limit_per_host", 256)
+        # Nombre max de requêtes chat() simultanées sur ce backend (session partagée)
+        self.max_parallel_requests = kwargs.get("max_parallel_requests", 32)
+        self._request_semaphore = asyncio.Semaphore(self.max_parallel_requests)
+        # Tokens des arguments de tool calls, par id(tool_call) : évite de
+        # re-sérialiser les arguments de tout l'historique à chaque estimation
+        self._tool_call_tokens: dict[int, tuple[ToolCall, int]] = {}
+        # Tokens par message, par id(msg) : l'historique ne fait que s'allonger,
+        # seuls les nouveaux messages sont estimés à chaque tour
+        self._message_tokens: dict[int, tuple[Message, int]] = {}
         # Info de retry en cours (lue par le spinner dans app.py)
         self.retry_info: dict | None = None  # None = pas de retry en cours
         # Compteurs cumulatifs pour la requête en cours (reset avant chaque agent.run)
-        self.cumulative_usage: dict = {
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "total_tokens": 0,
-            "api_calls": 0,
-        }
+        self.cumulative_usage = CumulativeUsage()
+        self.last_usage: CallUsage | None = None  # Statistiques du dernier appel
 
     def reset_cumulative_usage(self) -> None:
         """Remet à zéro les compteurs cumulatifs (à appeler avant chaque agent.run)."""
-        self.cumulative_usage = {
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "total_tokens": 0,
-            "api_calls": 0,
-        }
+        self.cumulative_usage = CumulativeUsage()
 
     def _accumulate_usage(self, prompt_tokens: int, completion_tokens: int) -> None:
         """Accumule les tokens dans le compteur cumulatif.
@@ -93,14 +235,17 @@ class Backend(ABC):
             prompt_tokens: Tokens du prompt de cet appel
             completion_tokens: Tokens de la réponse de cet appel
         """
-        self.cumulative_usage["prompt_tokens"] += prompt_tokens
-        self.cumulative_usage["completion_tokens"] += completion_tokens
-        self.cumulative_usage["total_tokens"] += prompt_tokens + completion_tokens
-        self.cumulative_usage["api_calls"] += 1
+        usage = self.cumulative_usage
+        usage.prompt_tokens += prompt_tokens
+        usage.completion_tokens += completion_tokens
+        usage.total_tokens += prompt_tokens + completion_tokens
+        usage.api_calls += 1
 
     def _limit_tool_calls(self, tool_calls: list[ToolCall] | None) -> list[ToolCall] | None:
         """Limite le nombre de tool calls selon max_parallel_tools.
 
+        Journalise la troncature lorsqu'elle a lieu.
+
         Args:
             tool_calls: Liste des tool calls à limiter
 
@@ -111,18 +256,90 @@ class Backend(ABC):
             return tool_calls
 
         if len(tool_calls) > self.max_parallel_tools:
+            logger.info(
+                f"Limited tool calls from {len(tool_calls)} to {self.max_parallel_tools} "
+                "(max_parallel_tools setting)"
+            )
             return tool_calls[:self.max_parallel_tools]
 
         return tool_calls
 
+    async def execute_tool_calls(
+        self,
+        tool_calls: list[ToolCall],
+        runner: Callable[[ToolCall], Awaitable[Any]],
+        return_exceptions: bool = True,
+        can_run_parallel: Callable[[ToolCall], bool] | None = None,
+    ) -> list[Any]:
+        """Exécute des tool calls dans l'ordre de la réponse.
+
+        Par défaut les appels s'exécutent un par un : un tool peut dépendre de
+        l'effet d'un appel précédent (ex: read_file après write_file). Seules
+        les suites d'appels consécutifs acceptés par can_run_parallel (tools en
+        lecture seule) sont lancées en parallèle, au plus max_parallel_tools à
+        la fois. Les résultats sont retournés dans l'ordre des tool calls, ce
+        qui permet de les apparier avec zip(tool_calls, results).
+
+        Args:
+            tool_calls: Tool calls à exécuter
+            runner: Coroutine exécutant un tool call et retournant son résultat
+            return_exceptions: Si True, une exception levée par runner est
+                retournée à la place du résultat au lieu d'être propagée
+            can_run_parallel: Indique si un tool call peut s'exécuter en même
+                temps que ses voisins (None = exécution entièrement séquentielle)
+
+        Returns:
+            Liste des résultats, dans le même ordre que tool_calls
+        """
+        results: list[Any] = []
+        i = 0
+        while i < len(tool_calls):
+            # Suite d'appels parallélisables à partir de la position courante
+            j = i
+            if can_run_parallel is not None:
+                while j < len(tool_calls) and can_run_parallel(tool_calls[j]):
+                    j += 1
+
+            if j - i > 1:
+                group = tool_calls[i:j]
+                semaphore = asyncio.Semaphore(self.max_parallel_tools or len(group))
+
+                async def _run(tool_call: ToolCall) -> Any:
+                    async with semaphore:
+                        return await runner(tool_call)
+
+                results.extend(
+                    await asyncio.gather(
+                        *(_run(tc) for tc in group), return_exceptions=return_exceptions
+                    )
+                )
+                i = j
+                continue
+
+            # Appel seul (effet de bord possible, ou groupe d'un seul élément)
+            try:
+                results.append(await runner(tool_calls[i]))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+            i += 1
+
+        return results
+
     async def _retry_on_error(
         self,
         coro_factory: Callable,
         max_retries: int = 3,
         base_delay: float = 2.0,
         retryable_status: tuple[int, ...] = (429, 500, 502, 503, 504),
+        max_delay: float = 60.0,
     ):
-        """Exécute une coroutine avec retry et backoff exponentiel.
+        """Exécute une coroutine avec retry et backoff exponentiel aléatoire.
+
+        Le délai est tiré au hasard entre base_delay et base_delay * 2^tentative
+        (jitter) pour que des requêtes concurrentes limitées en même temps (429)
+        ne réessaient pas toutes au même instant.
 
         Met à jour `self.retry_info` pendant les tentatives pour que le spinner
         puisse afficher l'état en temps réel.
@@ -130,8 +347,9 @@ class Backend(ABC):
         Args:
             coro_factory: Callable sans argument retournant une coroutine
             max_retries: Nombre maximum de nouvelles tentatives (défaut: 3)
-            base_delay: Délai initial en secondes (doublé à chaque tentative)
+            base_delay: Délai initial en secondes (borne max doublée à chaque tentative)
             retryable_status: Codes HTTP qui déclenchent un retry
+            max_delay: Délai maximum en secondes entre deux tentatives
 
         Returns:
             Résultat de la coroutine si succès
@@ -158,7 +376,10 @@ class Backend(ABC):
                     self.retry_info = None
                     raise
 
-                delay = base_delay * (2 ** attempt)  # 2s → 4s → 8s
+                # 2s → 2-4s → 2-8s, plafonné à max_delay
+                delay = min(
+                    random.uniform(base_delay, base_delay * (2 ** attempt)), max_delay
+                )
                 self.retry_info = {
                     "attempt": attempt + 1,
                     "max_retries": max_retries,
@@ -176,12 +397,12 @@ class Backend(ABC):
         raise last_error
 
     def estimate_tokens(self, text: str) -> int:
-        """Estimation rapide du nombre de tokens (heuristique).
+        """Estimation du nombre de tokens (voir count_tokens).
 
-        Règle : ~3 caractères par token (marge de sécurité vs la moyenne de 4).
+        ~3 caractères par token, ou le compte tiktoken s'il est plus élevé.
         Suffisant pour du budgeting de contexte.
         """
-        return len(text) // 3
+        return count_tokens(text)
 
     def estimate_messages_tokens(self, messages: list["Message"]) -> int:
         """Estime le nombre total de tokens dans une liste de messages.
@@ -192,16 +413,55 @@ class Backend(ABC):
         Returns:
             Estimation du nombre de tokens
         """
+        cache = self._message_tokens
         total = 0
         for msg in messages:
-            total += 4  # Overhead par message (role + délimiteurs)
-            total += self.estimate_tokens(msg.content or "")
+            # Les messages sont figés : une entrée (qui garde une référence au
+            # message, donc son id) reste valide tant qu'elle est en cache
+            entry = cache.get(id(msg))
+            if entry is not None:
+                total += entry[1]
+                continue
+
+            tokens = 4  # Overhead par message (role + délimiteurs)
+            tokens += self.estimate_tokens(msg.content)
             if msg.tool_calls:
                 for tc in msg.tool_calls:
-                    total += self.estimate_tokens(json.dumps(tc.arguments))
-                    total += self.estimate_tokens(tc.name)
+                    tokens += self._estimate_tool_call_tokens(tc)
+
+            if len(cache) >= _MESSAGE_TOKENS_CACHE_SIZE:
+                del cache[next(iter(cache))]  # Éviction du plus ancien
+            cache[id(msg)] = (msg, tokens)
+            total += tokens
         return total
 
+    def _estimate_tool_call_tokens(self, tool_call: "ToolCall") -> int:
+        """Estime les tokens d'un tool call (nom + arguments sérialisés), avec cache.
+
+        L'entrée du cache garde une référence au tool call (son id ne peut donc
+        pas être réutilisé). ToolCall est figé et ses arguments sont traités
+        comme immuables : l'entrée reste valide tant qu'elle est en cache.
+
+        Args:
+            tool_call: Tool call à estimer
+
+        Returns:
+            Estimation du nombre de tokens
+        """
+        cache = self._tool_call_tokens
+        key = id(tool_call)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[1]
+
+        tokens = self.estimate_tokens(json.dumps(tool_call.arguments))
+        tokens += self.estimate_tokens(tool_call.name)
+
+        if key not in cache and len(cache) >= _TOOL_CALL_CACHE_SIZE:
+            del cache[next(iter(cache))]  # Éviction du plus ancien
+        cache[key] = (tool_call, tokens)
+        return tokens
+
     @abstractmethod
     async def chat(
         self,
@@ -1,16 +1,173 @@
 """Backend Ollama pour agentichat."""
 
 import json
+import logging
 import re
-from typing import AsyncIterator
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 import aiohttp
 
+try:
+    import httpx
+    import h2  # noqa: F401 - requis par httpx pour HTTP/2
+except ImportError:  # Dépendances optionnelles (extra "http2")
+    httpx = None
+
+from ..utils.json_utils import JSONDecodeError, dumps_bytes, loads
 from ..utils.logger import get_logger
-from .base import Backend, BackendError, ChatResponse, Message, ToolCall
+from .base import (
+    Backend,
+    BackendError,
+    CallUsage,
+    ChatResponse,
+    Message,
+    ToolCall,
+    new_tool_call_id,
+)
 
 logger = get_logger("agentichat.backends.ollama")
 
+_JSON_DECODER = json.JSONDecoder()
+# Blocs markdown ```json ... ``` contenant des tool calls
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.+?)\s*```', re.DOTALL)
+# Objets JSON simples hors bloc : {"name": ..., "arguments": {...}}
+_POTENTIAL_JSON_RE = re.compile(r'\{[^{}]*"name"[^{}]*\{[^}]*\}[^{}]*\}')
+# Backslash non suivi d'un échappement JSON valide
+_UNESCAPED_BS_RE = re.compile(r'\\(?!["\\/bfnrtu])')
+
+# Type d'erreur BackendError par code HTTP (les autres : 5xx → SERVER_ERROR, sinon UNKNOWN)
+_STATUS_ERROR_TYPES = {
+    401: BackendError.AUTH_ERROR,
+    403: BackendError.AUTH_ERROR,
+    404: BackendError.MODEL_NOT_FOUND,
+    429: BackendError.RATE_LIMIT,
+}
+
+# En-têtes des requêtes dont le corps JSON est pré-sérialisé (data=bytes)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Nombre max de messages dont la conversion au format Ollama est gardée en cache
+_MESSAGE_CACHE_SIZE = 512
+
+# Taille max d'une ligne NDJSON du stream : au-delà, le flux est considéré
+# invalide (évite de bufferiser sans limite une réponse sans saut de ligne)
+_MAX_STREAM_LINE_BYTES = 4 * 1024 * 1024
+
+
+def _httpx_backend_error(error: Exception) -> BackendError:
+    """Convertit une erreur httpx en BackendError (timeout ou erreur de connexion).
+
+    Args:
+        error: Exception httpx.HTTPError levée par le client
+
+    Returns:
+        BackendError correspondante
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return BackendError(f"Timeout: {error}", error_type=BackendError.TIMEOUT)
+    return BackendError(f"Connection error: {error}", error_type=BackendError.SERVER_ERROR)
+
+
+def _decode_body(body: bytes) -> Any:
+    """Décode le corps JSON d'une réponse Ollama.
+
+    Args:
+        body: Corps brut de la réponse
+
+    Returns:
+        Document JSON décodé
+
+    Raises:
+        BackendError: Si le corps n'est pas du JSON valide (ex: page HTML d'un proxy)
+    """
+    try:
+        return loads(body)
+    except ValueError as e:  # JSONDecodeError (json ou orjson), UnicodeDecodeError
+        raise BackendError(
+            f"Invalid JSON response from Ollama: {e}",
+            error_type=BackendError.SERVER_ERROR,
+        ) from e
+
+
+async def _split_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Découpe un flux de blocs d'octets en lignes (NDJSON), de taille bornée.
+
+    Args:
+        chunks: Blocs bruts reçus du serveur, de taille quelconque
+
+    Yields:
+        Lignes sans le saut de ligne final
+
+    Raises:
+        BackendError: Si une ligne dépasse _MAX_STREAM_LINE_BYTES
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            yield bytes(buffer[start:end])
+            start = end + 1
+        del buffer[:start]
+        if len(buffer) > _MAX_STREAM_LINE_BYTES:
+            raise BackendError(
+                f"Ollama stream line exceeds {_MAX_STREAM_LINE_BYTES} bytes",
+                error_type=BackendError.SERVER_ERROR,
+            )
+    if buffer:
+        yield bytes(buffer)
+
+
+def _decode_json_object(text: str, idx: int) -> tuple[Any, int]:
+    """Décode la valeur JSON qui commence à la position idx d'un texte.
+
+    Si le décodage échoue, réessaie après avoir échappé les backslashes non
+    échappés (regex dans les arguments, ex: \\d+ → \\\\d+).
+
+    Args:
+        text: Texte contenant la valeur JSON
+        idx: Position du début de la valeur
+
+    Returns:
+        Tuple (valeur décodée, position de fin dans text)
+
+    Raises:
+        json.JSONDecodeError: Si la valeur est invalide même après correction
+    """
+    try:
+        return _JSON_DECODER.raw_decode(text, idx)
+    except json.JSONDecodeError:
+        tail = text[idx:]
+        value, end = _JSON_DECODER.raw_decode(
+            _UNESCAPED_BS_RE.sub(r'\\\\', tail)
+        )
+        logger.debug("Parsed JSON after fixing unescaped backslashes")
+
+    # Ramener la position de fin dans le texte d'origine (chaque correction
+    # a ajouté un caractère avant la fin de la valeur décodée)
+    added = 0
+    for match in _UNESCAPED_BS_RE.finditer(tail):
+        if match.start() + added >= end:
+            break
+        added += 1
+    return value, idx + end - added
+
+
+def _classify_http_error(status_code: int) -> str:
+    """Retourne le type BackendError correspondant à un code HTTP d'erreur.
+
+    Args:
+        status_code: Code HTTP de la réponse
+
+    Returns:
+        Une des constantes BackendError (RATE_LIMIT, AUTH_ERROR, etc.)
+    """
+    error_type = _STATUS_ERROR_TYPES.get(status_code)
+    if error_type is not None:
+        return error_type
+    return BackendError.SERVER_ERROR if status_code >= 500 else BackendError.UNKNOWN
+
 
 class OllamaBackend(Backend):
     """Backend pour serveur Ollama local ou distant."""
@@ -18,7 +175,26 @@ class OllamaBackend(Backend):
     def __init__(self, *args, **kwargs):
         """Initialise le backend Ollama."""
         super().__init__(*args, **kwargs)
-        self.last_usage: dict | None = None  # Dernières statistiques d'utilisation
+        self._session: aiohttp.ClientSession | None = None  # Session HTTP persistante
+        # Client HTTP des requêtes de chat : "aiohttp" (HTTP/1.1) ou "httpx" (HTTP/2
+        # si l'URL est en https : requêtes multiplexées sur une seule connexion)
+        self.transport = kwargs.get("transport", "aiohttp")
+        if self.transport == "httpx" and httpx is None:
+            logger.warning(
+                "Transport 'httpx' demandé mais httpx[http2] n'est pas installé "
+                "(pip install agentichat[http2]), utilisation d'aiohttp"
+            )
+            self.transport = "aiohttp"
+        self._http_client = None  # httpx.AsyncClient, créé au premier usage
+        # Conversions Message -> dict Ollama, par id(msg) : l'historique est renvoyé
+        # en entier à chaque tour mais seuls les nouveaux messages changent
+        self._message_cache: dict[int, tuple[Message, dict]] = {}
+        # Partie fixe du payload de chat (le modèle est mis à jour par set_model)
+        self._options = {
+            "num_predict": self.max_tokens,
+            "temperature": self.temperature,
+        }
+        self._base_payload = {"model": self.model, "options": self._options}
 
     def _extract_tool_calls_from_text(self, content: str) -> list[ToolCall] | None:
         """Extrait les tool calls du texte si le modèle les génère en JSON.
@@ -29,69 +205,39 @@ class OllamaBackend(Backend):
         Returns:
             Liste de ToolCall ou None si aucun trouvé
         """
-        import uuid
+        # Sortie rapide : sans bloc ```json ni clé "name", aucun tool call possible
+        if '"name"' not in content and "```json" not in content:
+            return None
 
         tool_calls = []
 
-        # Étape 1: Extraire le contenu des blocs ```json ... ```
-        json_code_blocks = re.findall(r'```json\s*(.+?)\s*```', content, re.DOTALL)
-
-        # Pour chaque bloc de code JSON, extraire tous les objets JSON
+        # Étape 1: Décoder les objets JSON des blocs ```json ... ```
+        # (raw_decode parcourt chaque bloc en une passe, objets multi-lignes compris)
         json_objects = []
-        for block in json_code_blocks:
-            # Trouver tous les objets JSON dans le bloc (peuvent être sur plusieurs lignes)
-            # On cherche des objets qui commencent par { et finissent par }
-            # et qui contiennent "name" et "arguments"
-            lines = block.strip().split('\n')
-            current_obj = ""
-            brace_count = 0
-
-            for line in lines:
-                stripped = line.strip()
-                if not stripped:
+        for block in _JSON_BLOCK_RE.findall(content):
+            idx = block.find("{")
+            while idx != -1:
+                try:
+                    data, end = _decode_json_object(block, idx)
+                except json.JSONDecodeError:
+                    logger.debug(f"Failed to parse JSON: {block[idx:idx + 100]}...")
+                    idx = block.find("{", idx + 1)
                     continue
-
-                current_obj += line + "\n"
-
-                # Compter les accolades pour savoir quand l'objet est complet
-                brace_count += line.count('{') - line.count('}')
-
-                # Si on a un objet complet (brace_count retourne à 0)
-                if brace_count == 0 and current_obj.strip():
-                    json_objects.append(current_obj.strip())
-                    current_obj = ""
+                json_objects.append(data)
+                idx = block.find("{", end)
 
         # Si pas de blocs markdown, chercher directement des objets JSON dans le texte
         if not json_objects:
             # Pattern pour JSONs simples (supporter "arguments" et "parameters")
             # Chercher tous les objets avec "name" et un objet imbriqué
-            potential_jsons = re.findall(r'\{[^{}]*"name"[^{}]*\{[^}]*\}[^{}]*\}', content)
-            json_objects.extend(potential_jsons)
-
-        # Parser chaque objet JSON trouvé
-        for json_str in json_objects:
-            data = None
-
-            # Tentative 1 : parsing JSON direct
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-
-            # Tentative 2 : corriger les backslashes non échappés (regex dans JSON)
-            # ex: \s+ → \\s+, \d+ → \\d+, \. → \\.
-            if data is None:
+            for json_str in _POTENTIAL_JSON_RE.findall(content):
                 try:
-                    fixed = re.sub(r'\\(?!["\\/bfnrtu])', r'\\\\', json_str)
-                    data = json.loads(fixed)
-                    logger.debug("Parsed JSON after fixing unescaped backslashes")
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-            if data is None:
-                logger.debug(f"Failed to parse JSON: {json_str[:100]}...")
-                continue
+                    json_objects.append(_decode_json_object(json_str, 0)[0])
+                except json.JSONDecodeError:
+                    logger.debug(f"Failed to parse JSON: {json_str[:100]}...")
 
+        # Convertir chaque objet JSON trouvé en tool call
+        for data in json_objects:
             if isinstance(data, dict) and "name" in data:
                 # Valider que le tool call a un nom non vide
                 tool_name = data.get("name", "").strip()
@@ -104,7 +250,7 @@ class OllamaBackend(Backend):
                     arguments = {}
 
                 tool_call = ToolCall(
-                    id=str(uuid.uuid4()),
+                    id=new_tool_call_id(),
                     name=tool_name,
                     arguments=arguments,
                 )
@@ -113,6 +259,107 @@ class OllamaBackend(Backend):
 
         return tool_calls if tool_calls else None
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Retourne la session HTTP persistante, en en créant une si nécessaire.
+
+        Le connecteur garde les connexions TCP ouvertes (keep-alive) entre les
+        appels successifs de la boucle agentique.
+
+        Returns:
+            Session aiohttp réutilisable entre les appels API.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.connector_limit_per_host,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Retourne le client httpx persistant, en en créant un si nécessaire.
+
+        Utilisé quand transport == "httpx". HTTP/2 n'est activé que pour une URL
+        https (négocié par ALPN) : les requêtes concurrentes partagent alors une
+        connexion au lieu d'ouvrir une connexion TCP chacune. En http clair
+        (Ollama local), le client reste en HTTP/1.1.
+
+        Returns:
+            Client httpx réutilisable entre les appels API.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=self.url.startswith("https://"),
+                limits=httpx.Limits(
+                    max_connections=self.connector_limit,
+                    max_keepalive_connections=self.connector_limit,
+                    keepalive_expiry=60,
+                ),
+                timeout=self.timeout,
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Ferme proprement la session HTTP persistante (et le client httpx).
+
+        À appeler à la sortie de l'application.
+        """
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self._session = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _message_to_dict(self, msg: Message) -> dict:
+        """Convertit un Message au format Ollama, avec cache par message.
+
+        L'entrée du cache garde une référence au message (son id ne peut donc pas
+        être réutilisé par un autre objet). Message et ToolCall sont figés et les
+        arguments des tool calls sont traités comme immuables : l'entrée reste
+        valide tant qu'elle est en cache.
+
+        Args:
+            msg: Message à convertir
+
+        Returns:
+            Dict prêt à être sérialisé dans le payload
+        """
+        cache = self._message_cache
+        key = id(msg)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[1]
+
+        message_dict = {
+            "role": msg.role,
+            "content": msg.content,
+        }
+
+        # Convertir les tool_calls (objets ToolCall) en dictionnaires
+        if msg.tool_calls:
+            message_dict["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": tc.arguments,
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+
+        if key not in cache and len(cache) >= _MESSAGE_CACHE_SIZE:
+            del cache[next(iter(cache))]  # Éviction du plus ancien
+        cache[key] = (msg, message_dict)
+        return message_dict
+
     async def chat(
         self,
         messages: list[Message],
@@ -136,138 +383,181 @@ class OllamaBackend(Backend):
         endpoint = f"{self.url}/api/chat"
 
         # Convertir les messages au format Ollama
-        ollama_messages = []
-        for msg in messages:
-            message_dict = {
-                "role": msg.role,
-                "content": msg.content,
-            }
-
-            # Convertir les tool_calls (objets ToolCall) en dictionnaires
-            if msg.tool_calls:
-                message_dict["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": tc.arguments,
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
-
-            ollama_messages.append(message_dict)
+        ollama_messages = [self._message_to_dict(msg) for msg in messages]
 
         # Construire la requête
-        payload = {
-            "model": self.model,
-            "messages": ollama_messages,
-            "stream": stream,
-            "options": {
-                "num_predict": self.max_tokens,
-                "temperature": self.temperature,
-            },
-        }
+        payload = {**self._base_payload, "messages": ollama_messages, "stream": stream}
 
         # Ajouter les tools si fournis
         if tools:
             payload["tools"] = tools
             logger.debug(f"Sending request with {len(tools)} tools")
-            logger.debug(f"Tools payload: {json.dumps(tools, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Tools payload: {json.dumps(tools, indent=2)}")
 
         logger.debug(
             f"Ollama request: model={self.model}, messages={len(messages)}, "
             f"stream={stream}, timeout={self.timeout}s"
         )
 
+        # Sérialiser une seule fois (orjson si disponible), réutilisé par les retries
+        body = dumps_bytes(payload)
+
         if stream:
             # Pour le streaming, on doit garder la session ouverte (pas de retry)
             logger.debug("Starting streaming chat")
-            return self._stream_chat(endpoint, payload)
+            return self._stream_chat(endpoint, body)
 
         # Pour le non-streaming : retry automatique sur erreurs transitoires
         logger.debug("Starting non-streaming chat")
 
         async def _do_request():
+            if self.transport == "httpx":
+                return await self._httpx_request(endpoint, body)
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        endpoint,
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=self.timeout),
-                    ) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            error_type = (
-                                BackendError.MODEL_NOT_FOUND if response.status == 404
-                                else BackendError.SERVER_ERROR if response.status >= 500
-                                else BackendError.UNKNOWN
-                            )
-                            raise BackendError(
-                                f"Ollama error: {error_text}",
-                                status_code=response.status,
-                                error_type=error_type,
-                            )
-                        return await self._parse_response(response)
+                session = await self._get_session()
+                async with session.post(
+                    endpoint,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise BackendError(
+                            f"Ollama error: {error_text}",
+                            status_code=response.status,
+                            error_type=_classify_http_error(response.status),
+                        )
+                    return await self._parse_response(response)
             except aiohttp.ServerTimeoutError as e:
                 raise BackendError(
                     f"Timeout: {e}", error_type=BackendError.TIMEOUT
                 ) from e
             except aiohttp.ClientError as e:
+                # La session est conservée : le connecteur écarte de lui-même
+                # les connexions mortes
                 raise BackendError(
                     f"Connection error: {e}", error_type=BackendError.SERVER_ERROR
                 ) from e
 
         return await self._retry_on_error(_do_request)
 
-    async def _stream_chat(self, endpoint: str, payload: dict) -> AsyncIterator[str]:
+    async def _httpx_request(self, endpoint: str, body: bytes) -> ChatResponse:
+        """Envoie une requête de chat non streamée via le client httpx (HTTP/2).
+
+        Args:
+            endpoint: URL de l'endpoint
+            body: Payload JSON déjà sérialisé
+
+        Returns:
+            ChatResponse avec le contenu et éventuels tool calls
+
+        Raises:
+            BackendError: En cas d'erreur de communication
+        """
+        client = self._get_http_client()
+        try:
+            response = await client.post(endpoint, content=body, headers=_JSON_HEADERS)
+        except httpx.HTTPError as e:
+            raise _httpx_backend_error(e) from e
+
+        if response.status_code != 200:
+            raise BackendError(
+                f"Ollama error: {response.text}",
+                status_code=response.status_code,
+                error_type=_classify_http_error(response.status_code),
+            )
+        return self._build_response(_decode_body(response.content))
+
+    async def _stream_chat(self, endpoint: str, body: bytes) -> AsyncIterator[str]:
         """Stream la réponse d'Ollama avec session HTTP maintenue.
 
         Args:
             endpoint: URL de l'endpoint
-            payload: Données à envoyer
+            body: Payload JSON déjà sérialisé
 
         Yields:
             Chunks de texte au fur et à mesure
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    error_type = (
-                        BackendError.MODEL_NOT_FOUND if response.status == 404
-                        else BackendError.SERVER_ERROR if response.status >= 500
-                        else BackendError.UNKNOWN
-                    )
-                    raise BackendError(
-                        f"Ollama error: {error_text}",
-                        status_code=response.status,
-                        error_type=error_type,
-                    )
+        # aclosing : libérer la connexion dès la fin du stream (break sur "done")
+        async with aclosing(self._iter_stream_lines(endpoint, body)) as lines:
+            async for line in lines:
+                # Chaque message NDJSON est un objet : ignorer les lignes vides
+                # sans passer par le parseur
+                if line[:1] != b"{":
+                    continue
 
-                # Lire ligne par ligne
-                async for line in response.content:
-                    if not line:
-                        continue
+                try:
+                    data = loads(line)
+                    if "message" in data:
+                        content = data["message"].get("content", "")
+                        if content:
+                            yield content
 
-                    try:
-                        data = json.loads(line)
-                        if "message" in data:
-                            content = data["message"].get("content", "")
-                            if content:
-                                yield content
+                    # Fin du stream
+                    if data.get("done", False):
+                        break
 
-                        # Fin du stream
-                        if data.get("done", False):
-                            break
+                except JSONDecodeError:
+                    continue
 
-                    except json.JSONDecodeError:
-                        continue
+    async def _iter_stream_lines(self, endpoint: str, body: bytes) -> AsyncIterator[bytes]:
+        """Envoie une requête de chat streamée et renvoie la réponse ligne par ligne.
+
+        Args:
+            endpoint: URL de l'endpoint
+            body: Payload JSON déjà sérialisé
+
+        Yields:
+            Lignes brutes (NDJSON) de la réponse
+
+        Raises:
+            BackendError: Si le serveur répond avec un code d'erreur, ou si une
+                ligne dépasse _MAX_STREAM_LINE_BYTES
+        """
+        if self.transport == "httpx":
+            client = self._get_http_client()
+            # Erreurs httpx (à l'ouverture comme pendant la lecture du flux)
+            # traduites en BackendError, comme pour _httpx_request
+            try:
+                async with client.stream(
+                    "POST", endpoint, content=body, headers=_JSON_HEADERS
+                ) as response:
+                    if response.status_code != 200:
+                        error_text = (await response.aread()).decode("utf-8", errors="replace")
+                        raise BackendError(
+                            f"Ollama error: {error_text}",
+                            status_code=response.status_code,
+                            error_type=_classify_http_error(response.status_code),
+                        )
+
+                    async with aclosing(_split_lines(response.aiter_bytes())) as lines:
+                        async for line in lines:
+                            yield line
+            except httpx.HTTPError as e:
+                raise _httpx_backend_error(e) from e
+            return
+
+        session = await self._get_session()
+        async with session.post(
+            endpoint,
+            data=body,
+            headers=_JSON_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise BackendError(
+                    f"Ollama error: {error_text}",
+                    status_code=response.status,
+                    error_type=_classify_http_error(response.status),
+                )
+
+            # Lire par blocs et découper en lignes (NDJSON), longueur de ligne bornée
+            async with aclosing(_split_lines(response.content.iter_any())) as lines:
+                async for line in lines:
+                    yield line
 
     async def _parse_response(self, response: aiohttp.ClientResponse) -> ChatResponse:
         """Parse la réponse complète d'Ollama.
@@ -275,11 +565,25 @@ class OllamaBackend(Backend):
         Args:
             response: Réponse HTTP d'Ollama
 
+        Returns:
+            ChatResponse avec le contenu et éventuels tool calls
+        
+        Raises:
+            BackendError: Si le corps n'est pas du JSON valide
+        """
+        return self._build_response(_decode_body(await response.read()))
+
+    def _build_response(self, data: dict) -> ChatResponse:
+        """Construit la ChatResponse à partir du JSON de réponse d'Ollama.
+
+        Args:
+            data: Réponse d'Ollama décodée
+
         Returns:
             ChatResponse avec le contenu et éventuels tool calls
         """
-        data = await response.json()
-        logger.debug(f"Ollama response data: {json.dumps(data, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Ollama response data: {json.dumps(data, indent=2)}")
 
         message = data.get("message", {})
         content = message.get("content", "")
@@ -297,7 +601,7 @@ class OllamaBackend(Backend):
                 if isinstance(args_raw, dict):
                     arguments = args_raw
                 elif isinstance(args_raw, str):
-                    arguments = json.loads(args_raw)
+                    arguments = loads(args_raw)
                 else:
                     arguments = {}
 
@@ -318,8 +622,6 @@ class OllamaBackend(Backend):
 
         # Limiter le nombre de tool calls si nécessaire
         tool_calls = self._limit_tool_calls(tool_calls)
-        if tool_calls and self.max_parallel_tools and len(tool_calls) == self.max_parallel_tools:
-            logger.info(f"Limited tool calls to {self.max_parallel_tools} (max_parallel_tools setting)")
 
         # Déterminer la raison de fin
         finish_reason = "stop"
@@ -344,14 +646,15 @@ class OllamaBackend(Backend):
         # Stocker les statistiques détaillées pour affichage
         prompt_tokens = data.get("prompt_eval_count", 0)
         completion_tokens = data.get("eval_count", 0)
-        self.last_usage = {
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "prompt_eval_duration_ms": data.get("prompt_eval_duration", 0) / 1_000_000,  # ns -> ms
-            "eval_duration_ms": data.get("eval_duration", 0) / 1_000_000,  # ns -> ms
-            "total_duration_ms": data.get("total_duration", 0) / 1_000_000,  # ns -> ms
-            "load_duration_ms": data.get("load_duration", 0) / 1_000_000,  # ns -> ms
-        }
+        self.last_usage = CallUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            prompt_eval_duration_ms=data.get("prompt_eval_duration", 0) / 1_000_000,  # ns -> ms
+            eval_duration_ms=data.get("eval_duration", 0) / 1_000_000,  # ns -> ms
+            total_duration_ms=data.get("total_duration", 0) / 1_000_000,  # ns -> ms
+            load_duration_ms=data.get("load_duration", 0) / 1_000_000,  # ns -> ms
+        )
         # Accumuler dans le compteur cumulatif
         self._accumulate_usage(prompt_tokens, completion_tokens)
 
@@ -371,19 +674,19 @@ class OllamaBackend(Backend):
         endpoint = f"{self.url}/api/tags"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint, timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise BackendError(
-                            f"Ollama error: {error_text}", status_code=response.status
-                        )
+            session = await self._get_session()
+            async with session.get(
+                endpoint, timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise BackendError(
+                        f"Ollama error: {error_text}", status_code=response.status
+                    )
 
-                    data = await response.json()
-                    models = data.get("models", [])
-                    return [model["name"] for model in models]
+                data = await response.json()
+                models = data.get("models", [])
+                return [model["name"] for model in models]
 
         except aiohttp.ClientError as e:
             raise BackendError(f"Connection error: {e}") from e
@@ -394,10 +697,18 @@ class OllamaBackend(Backend):
         Returns:
             True si le serveur répond, False sinon
         """
+        # /api/version : réponse de quelques octets, contrairement à /api/tags
+        # qui décrit tous les modèles installés
+        endpoint = f"{self.url}/api/version"
+
         try:
-            await self.list_models()
-            return True
-        except BackendError:
+            session = await self._get_session()
+            async with session.get(
+                endpoint,
+                timeout=aiohttp.ClientTimeout(total=3),
+            ) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, TimeoutError):
             return False
 
     def set_model(self, model: str) -> None:
@@ -408,3 +719,4 @@ class OllamaBackend(Backend):
         """
         logger.info(f"Switching model from {self.model} to {model}")
         self.model = model
+        self._base_payload["model"] = model
@@ -1,14 +1,110 @@
 """Gestionnaire des commandes Albert API directes."""
 
-from typing import Any
+import asyncio
+import functools
+import hashlib
+import inspect
+import os
+import tempfile
+import time
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, TypeVar
 
 import aiohttp
+from multidict import CIMultiDict
+
+try:
+    import httpx
+    import h2  # noqa: F401 - requis par httpx pour HTTP/2
+except ImportError:  # Dépendances optionnelles (extra "http2")
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # Dépendance optionnelle (extra "perf")
+    ijson = None
 
 from ..backends.base import BackendError
+from ..utils.json_utils import JSONDecodeError, dumps_bytes, loads
 from ..utils.logger import get_logger
 
 logger = get_logger("agentichat.cli.albert")
 
+# Chemins des endpoints de l'API Albert
+_MODELS_PATH = "/v1/models"
+_USAGE_PATH = "/v1/me/usage"
+_USER_INFO_PATH = "/v1/me/info"
+
+# Nombre max de requêtes get_model_info simultanées dans get_model_infos
+_MAX_CONCURRENT_INFO_REQUESTS = 10
+
+# Durée de validité (secondes) du cache des métadonnées de modèles
+_MODELS_CACHE_TTL = 60.0
+
+# Cache disque de la liste des modèles, partagé entre les lancements de la CLI
+# (désactivable avec AGENTICHAT_NO_CACHE=1, vidé par /albert refresh)
+_DISK_CACHE_TTL = 300.0
+
+# Erreurs de transport converties en BackendError par _translate_errors
+_TRANSPORT_ERRORS: tuple[type[Exception], ...] = (aiohttp.ClientError,)
+if httpx is not None:
+    _TRANSPORT_ERRORS += (httpx.HTTPError,)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _disk_cache_dir() -> Path:
+    """Retourne le répertoire du cache disque ($XDG_CACHE_HOME/agentichat).
+
+    Returns:
+        Répertoire du cache, ~/.cache/agentichat si XDG_CACHE_HOME n'est pas défini
+    """
+    base = os.getenv("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "agentichat"
+
+
+def _translate_errors(fn: _F) -> _F:
+    """Convertit les erreurs HTTP d'une méthode d'AlbertManager en BackendError.
+
+    S'applique aux coroutines comme aux générateurs asynchrones. En cas
+    d'erreur de connexion, la session possédée par le gestionnaire et le client
+    httpx sont fermés pour que l'appel suivant reparte d'une connexion neuve.
+
+    Args:
+        fn: Méthode asynchrone (ou générateur asynchrone) à envelopper
+
+    Returns:
+        Méthode enveloppée
+    """
+
+    async def _to_backend_error(self: "AlbertManager", e: Exception) -> BackendError:
+        await self._reset_connections()
+        return BackendError(f"Connection error: {e}")
+
+    if inspect.isasyncgenfunction(fn):
+
+        @functools.wraps(fn)
+        async def gen_wrapper(self: "AlbertManager", *args: Any, **kwargs: Any) -> Any:
+            try:
+                # aclosing : le générateur enveloppé est fermé avec l'enveloppe
+                async with aclosing(fn(self, *args, **kwargs)) as gen:
+                    async for item in gen:
+                        yield item
+            except _TRANSPORT_ERRORS as e:
+                raise await _to_backend_error(self, e) from e
+
+        return gen_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(fn)
+    async def wrapper(self: "AlbertManager", *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await fn(self, *args, **kwargs)
+        except _TRANSPORT_ERRORS as e:
+            raise await _to_backend_error(self, e) from e
+
+    return wrapper  # type: ignore[return-value]
+
 
 class AlbertManager:
     """Gestionnaire pour les commandes Albert API directes.
@@ -20,62 +116,382 @@ class AlbertManager:
     - Vérifier l'usage et les quotas
     """
 
-    def __init__(self, url: str, api_key: str, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        *,
+        session: aiohttp.ClientSession | None = None,
+        transport: str = "aiohttp",
+    ) -> None:
         """Initialise le gestionnaire.
 
         Args:
             url: URL de l'API Albert
             api_key: Clé API pour l'authentification
             timeout: Timeout pour les requêtes (par défaut 30s)
+            session: Session aiohttp externe à utiliser (pool de connexions partagé
+                avec le reste de l'application) ; elle n'est pas fermée par close()
+            transport: Client HTTP, "aiohttp" (HTTP/1.1) ou "httpx" (HTTP/2 si l'URL
+                est en https : les requêtes concurrentes de snapshot() partagent
+                une connexion)
         """
         self.url = url
         self.api_key = api_key
         self.timeout = timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout)  # Réutilisé par chaque requête
+        # URLs complètes construites une fois (l'URL de base ne change pas)
+        self._models_url = f"{url}{_MODELS_PATH}"
+        self._usage_url = f"{url}{_USAGE_PATH}"
+        self._user_info_url = f"{url}{_USER_INFO_PATH}"
+        # Headers d'authentification, fixes pour la durée de vie du gestionnaire :
+        # construits une fois et passés comme headers par défaut de la session.
+        # CIMultiDict est le type interne d'aiohttp : passés par requête (session
+        # externe), ils ne sont pas reconvertis à chaque appel
+        self._headers = CIMultiDict({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        })
+        self._session: aiohttp.ClientSession | None = session  # Session HTTP persistante
+        self._owns_session = session is None
+        # Une session externe n'a pas nos headers par défaut : les passer par requête
+        self._request_headers = None if self._owns_session else self._headers
+        self.transport = transport
+        if self.transport == "httpx" and httpx is None:
+            logger.warning(
+                "Transport 'httpx' demandé mais httpx[http2] n'est pas installé "
+                "(pip install agentichat[http2]), utilisation d'aiohttp"
+            )
+            self.transport = "aiohttp"
+        self._http_client = None  # httpx.AsyncClient, créé au premier usage
+        self._warmup_task: asyncio.Task | None = None  # Voir start_warmup()
+        # Caches des métadonnées de modèles (horodatage monotonic, valeur) : elles
+        # changent rarement, contrairement à l'usage et aux quotas (non cachés)
+        self._models_cache: tuple[float, list[dict[str, Any]]] | None = None
+        self._model_info_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Validateurs HTTP par endpoint (ETag, corps décodé) : les réponses
+        # inchangées (304) sont servies sans re-télécharger ni re-décoder
+        self._etags: dict[str, tuple[str, Any]] = {}
+        # Fichier du cache disque, propre à l'URL et à la clé (seul leur hash
+        # apparaît dans le nom) ; None si le cache disque est désactivé
+        if os.getenv("AGENTICHAT_NO_CACHE") == "1":
+            self._disk_cache_path: Path | None = None
+        else:
+            key = hashlib.sha256(f"{url}\0{api_key}".encode()).hexdigest()[:16]
+            self._disk_cache_path = _disk_cache_dir() / f"albert_models-{key}.json"
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Retourne la session HTTP persistante, en en créant une si nécessaire.
+
+        Les connexions TCP/TLS vers Albert restent ouvertes (keep-alive) entre
+        deux commandes /albert au lieu d'être rétablies à chaque appel.
 
-    def _get_headers(self) -> dict[str, str]:
-        """Retourne les headers HTTP avec authentification.
+        Returns:
+            Session aiohttp réutilisable entre les appels API.
+        """
+        if not self._owns_session:
+            return self._session
+        if self._session is None or self._session.closed:
+            # Petit pool pour un seul hôte, DNS mis en cache 5 min, connexions
+            # à moitié fermées nettoyées (sinon reconnexions inutiles)
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._headers,
+                timeout=self._timeout,
+            )
+        return self._session
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Retourne le client httpx persistant, en en créant un si nécessaire.
+
+        Utilisé quand transport == "httpx". HTTP/2 n'est activé que pour une URL
+        https (négocié par ALPN).
 
         Returns:
-            Headers avec Bearer token
+            Client httpx réutilisable entre les appels API.
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=self.url.startswith("https://"),
+                headers=dict(self._headers),
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Ferme proprement la session HTTP persistante (et le client httpx).
+
+        À appeler quand le gestionnaire n'est plus utilisé. Une session fournie
+        au constructeur reste ouverte (elle appartient à l'appelant).
+        """
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        await self._reset_connections()
+
+    async def _reset_connections(self) -> None:
+        """Ferme la session possédée et le client httpx (erreur de connexion, close()).
+
+        Ils seront recréés au prochain appel. Une session fournie au
+        constructeur n'est pas touchée (elle appartient à l'appelant).
+        """
+        if self._owns_session and self._session is not None:
+            if not self._session.closed:
+                await self._session.close()
+            self._session = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def warmup(self) -> None:
+        """Ouvre à l'avance la connexion TCP/TLS vers Albert.
+
+        Envoie un HEAD sur l'endpoint des modèles : la première vraie commande
+        trouve une connexion keep-alive prête dans le pool au lieu de payer la
+        poignée de main. Les erreurs sont ignorées (simple optimisation).
+        """
+        try:
+            if self.transport == "httpx":
+                await self._get_http_client().head(self._models_url)
+            else:
+                session = await self._get_session()
+                async with session.head(
+                    self._models_url,
+                    headers=self._request_headers,
+                    timeout=self._timeout,
+                ):
+                    pass
+        except (*_TRANSPORT_ERRORS, TimeoutError) as e:
+            logger.debug(f"Préchauffage de la connexion Albert échoué: {e}")
+
+    def start_warmup(self) -> None:
+        """Lance warmup() en tâche de fond, pendant le reste de l'initialisation.
+
+        Doit être appelée depuis une boucle asyncio en cours d'exécution.
+        """
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = asyncio.create_task(self.warmup())
+
+    async def invalidate_cache(self) -> None:
+        """Vide les caches de métadonnées de modèles (prochain appel = requête API).
+
+        Utilisé par /albert refresh. Le fichier du cache disque est supprimé
+        dans un thread.
+        """
+        self._models_cache = None
+        self._model_info_cache.clear()
+        self._etags.clear()
+        if self._disk_cache_path is not None:
+            try:
+                await asyncio.to_thread(self._disk_cache_path.unlink, missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Cache disque des modèles non supprimé: {e}")
+
+    def _read_disk_cache(self) -> list[dict[str, Any]] | None:
+        """Lit la liste des modèles depuis le cache disque s'il est encore valide.
+
+        Bloquant : appelé dans un thread par list_models.
+
+        Returns:
+            Liste des modèles, ou None si le cache est absent, expiré ou illisible
+        """
+        path = self._disk_cache_path
+        if path is None:
+            return None
+        try:
+            if path.stat().st_mtime <= time.time() - _DISK_CACHE_TTL:
+                return None
+            return loads(path.read_bytes())
+        except (OSError, JSONDecodeError):
+            return None
+
+    def _write_disk_cache(self, models: list[dict[str, Any]]) -> None:
+        """Enregistre la liste des modèles dans le cache disque.
+
+        L'écriture passe par un fichier temporaire renommé ensuite : une CLI
+        lancée en parallèle ne lit jamais un fichier à moitié écrit. Bloquant :
+        appelé dans un thread par list_models.
+
+        Args:
+            models: Liste des modèles renvoyée par l'API
+        """
+        path = self._disk_cache_path
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(dumps_bytes(models))
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.debug(f"Cache disque des modèles non écrit: {e}")
+
+    async def __aenter__(self) -> "AlbertManager":
+        """Permet d'utiliser le gestionnaire avec ``async with``."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Ferme la session HTTP en sortie de bloc ``async with``."""
+        await self.close()
+
+    @staticmethod
+    async def _check_status(response: aiohttp.ClientResponse) -> None:
+        """Lève une BackendError si la réponse n'est pas un succès (200 ou 304).
+
+        Passé en raise_for_status aux requêtes : aiohttp l'appelle avant de
+        rendre la réponse, le code appelant ne traite donc que le cas nominal.
+
+        Args:
+            response: Réponse HTTP d'Albert
+
+        Raises:
+            BackendError: Avec le corps de la réponse d'erreur
+        """
+        if response.status not in (200, 304):
+            error_text = await response.text()
+            raise BackendError(
+                f"Albert API error: {error_text}", status_code=response.status
+            )
+
+    @_translate_errors
+    async def _get_json(self, endpoint: str) -> Any:
+        """Effectue un GET sur l'API Albert et décode la réponse JSON.
+
+        Si l'endpoint a déjà renvoyé un ETag, la requête est conditionnelle
+        (If-None-Match) et une réponse 304 renvoie le corps mis en cache.
+
+        Args:
+            endpoint: URL complète de l'endpoint
+
+        Returns:
+            Corps de la réponse décodé
+
+        Raises:
+            BackendError: En cas d'erreur HTTP, de connexion ou de JSON invalide
+        """
+        cached = self._etags.get(endpoint)
+
+        if self.transport == "httpx":
+            # Le client porte déjà les headers d'authentification
+            response = await self._get_http_client().get(
+                endpoint,
+                headers={"If-None-Match": cached[0]} if cached is not None else None,
+            )
+            status = response.status_code
+            if status not in (200, 304):
+                raise BackendError(
+                    f"Albert API error: {response.text}", status_code=status
+                )
+            resp_headers, body = response.headers, response.content
+        else:
+            headers = self._request_headers
+            if cached is not None:
+                headers = CIMultiDict(headers or ())
+                headers["If-None-Match"] = cached[0]
+            session = await self._get_session()
+            async with session.get(
+                endpoint,
+                headers=headers,
+                timeout=self._timeout,
+                raise_for_status=self._check_status,
+            ) as response:
+                status, resp_headers = response.status, response.headers
+                # Corps brut décodé directement (UTF-8) : évite la détection
+                # de charset de response.json() quand Content-Type n'en précise pas
+                body = await response.read()
+
+        if status == 304 and cached is not None:
+            return cached[1]
+        try:
+            data = loads(body)
+        except JSONDecodeError as e:
+            raise BackendError(f"Invalid JSON response from Albert API: {e}") from e
+        etag = resp_headers.get("ETag")
+        if etag:
+            self._etags[endpoint] = (etag, data)
+        else:
+            self._etags.pop(endpoint, None)
+        return data
 
     async def list_models(self) -> list[dict[str, Any]]:
         """Liste tous les modèles disponibles sur Albert.
 
+        Le résultat est mis en cache en mémoire pendant _MODELS_CACHE_TTL
+        secondes, et sur disque ($XDG_CACHE_HOME/agentichat) pendant
+        _DISK_CACHE_TTL secondes pour les lancements suivants de la CLI.
+
         Returns:
             Liste des modèles avec leurs métadonnées (id, owned_by, etc.)
 
         Raises:
             BackendError: En cas d'erreur
         """
-        endpoint = f"{self.url}/v1/models"
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL:
+            return cached[1]
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint,
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise BackendError(
-                            f"Albert API error: {error_text}", status_code=response.status
-                        )
-
-                    data = await response.json()
-                    return data.get("data", [])
-
-        except aiohttp.ClientError as e:
-            raise BackendError(f"Connection error: {e}") from e
+        models = await asyncio.to_thread(self._read_disk_cache)
+        if models is None:
+            data = await self._get_json(self._models_url)
+            models = data.get("data", [])
+            await asyncio.to_thread(self._write_disk_cache, models)
+        self._models_cache = (time.monotonic(), models)
+        return models
+
+    @_translate_errors
+    async def iter_models(self) -> AsyncIterator[dict[str, Any]]:
+        """Itère sur les modèles disponibles au fil de la lecture de la réponse.
+
+        Avec ijson, les modèles sont décodés un par un depuis le flux HTTP, sans
+        charger la réponse entière en mémoire. Sans ijson, avec le transport
+        httpx, ou si la liste est déjà en cache, itère sur list_models().
+
+        Yields:
+            Métadonnées de chaque modèle (id, owned_by, etc.)
+
+        Raises:
+            BackendError: En cas d'erreur
+        """
+        cached = self._models_cache
+        if ijson is None or self.transport == "httpx" or (
+            cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL
+        ):
+            for model in await self.list_models():
+                yield model
+            return
+
+        session = await self._get_session()
+        async with session.get(
+            self._models_url,
+            headers=self._request_headers,
+            timeout=self._timeout,
+            raise_for_status=self._check_status,
+        ) as response:
+            async for model in ijson.items_async(
+                response.content, "data.item", use_float=True
+            ):
+                yield model
 
     async def get_model_info(self, model_id: str) -> dict[str, Any]:
         """Récupère les informations détaillées d'un modèle.
 
+        Le résultat est mis en cache pendant _MODELS_CACHE_TTL secondes.
+
         Args:
             model_id: ID du modèle
 
@@ -85,25 +501,36 @@ class AlbertManager:
         Raises:
             BackendError: En cas d'erreur
         """
-        endpoint = f"{self.url}/v1/models/{model_id}"
+        cached = self._model_info_cache.get(model_id)
+        if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL:
+            return cached[1]
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint,
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise BackendError(
-                            f"Albert API error: {error_text}", status_code=response.status
-                        )
-
-                    return await response.json()
-
-        except aiohttp.ClientError as e:
-            raise BackendError(f"Connection error: {e}") from e
+        info = await self._get_json(f"{self._models_url}/{model_id}")
+        self._model_info_cache[model_id] = (time.monotonic(), info)
+        return info
+
+    async def get_model_infos(self, model_ids: list[str]) -> list[dict[str, Any]]:
+        """Récupère les informations de plusieurs modèles en parallèle.
+
+        Au plus _MAX_CONCURRENT_INFO_REQUESTS requêtes sont en vol à la fois ;
+        les modèles déjà en cache ne déclenchent pas de requête.
+
+        Args:
+            model_ids: IDs des modèles
+
+        Returns:
+            Informations de chaque modèle, dans l'ordre de model_ids
+
+        Raises:
+            BackendError: Si l'une des requêtes échoue
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_INFO_REQUESTS)
+
+        async def _fetch(model_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_model_info(model_id)
+
+        return await asyncio.gather(*(_fetch(model_id) for model_id in model_ids))
 
     async def get_usage(self) -> dict[str, Any]:
         """Récupère les statistiques d'utilisation.
@@ -114,25 +541,7 @@ class AlbertManager:
         Raises:
             BackendError: En cas d'erreur
         """
-        endpoint = f"{self.url}/v1/me/usage"
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint,
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise BackendError(
-                            f"Albert API error: {error_text}", status_code=response.status
-                        )
-
-                    return await response.json()
-
-        except aiohttp.ClientError as e:
-            raise BackendError(f"Connection error: {e}") from e
+        return await self._get_json(self._usage_url)
 
     async def get_user_info(self) -> dict[str, Any]:
         """Récupère les informations de l'utilisateur.
@@ -143,22 +552,21 @@ class AlbertManager:
         Raises:
             BackendError: En cas d'erreur
         """
-        endpoint = f"{self.url}/v1/me/info"
+        return await self._get_json(self._user_info_url)
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint,
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise BackendError(
-                            f"Albert API error: {error_text}", status_code=response.status
-                        )
-
-                    return await response.json()
-
-        except aiohttp.ClientError as e:
-            raise BackendError(f"Connection error: {e}") from e
+    async def snapshot(self) -> dict[str, Any]:
+        """Récupère modèles, usage et infos utilisateur en parallèle.
+
+        Les trois requêtes partent simultanément sur la session partagée :
+        la latence totale est celle de la plus lente, pas leur somme.
+
+        Returns:
+            Dict avec les clés "models", "usage" et "info"
+
+        Raises:
+            BackendError: Si l'une des requêtes échoue
+        """
+        models, usage, info = await asyncio.gather(
+            self.list_models(), self.get_usage(), self.get_user_info()
+        )
+        return {"models": models, "usage": usage, "info": info}
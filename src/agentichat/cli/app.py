@@ -1,31 +1,28 @@
 """Boucle CLI principale de agentichat."""
 
 import asyncio
-import pickle
+import functools
+import inspect
+import os
 import re
-import signal
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
+from prompt_toolkit import PromptSession
 from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.spinner import Spinner
-from rich.text import Text
-
-from ..backends.albert import AlbertBackend
-from ..backends.base import Backend, BackendError, Message
-from ..backends.ollama import OllamaBackend
+
+from ..backends.base import (
+    Backend,
+    BackendError,
+    CallUsage,
+    Message,
+    ToolCall,
+    load_token_encoding,
+)
 from ..config.loader import get_config_path, load_config, save_config
 from ..config.schema import Config
 from ..core.agent import AgentLoop
-from ..tools.albert_tools import (
-    AlbertEmbeddingsTool,
-    AlbertOCRTool,
-    AlbertSearchTool,
-    AlbertTranscriptionTool,
-)
 from ..tools.directory_ops import (
     CopyFileTool,
     CreateDirectoryTool,
@@ -34,26 +31,279 @@ from ..tools.directory_ops import (
 )
 from ..tools.file_ops import DeleteFileTool, ListFilesTool, ReadFileTool, WriteFileTool
 from ..tools.glob_tool import GlobTool
-from ..tools.registry import ToolRegistry
+from ..tools.registry import Tool, ToolRegistry
 from ..tools.search import SearchTextTool
 from ..tools.shell import ShellExecTool
 from ..tools.todo_tool import TodoWriteTool
 from ..tools.web_tools import WebFetchTool, WebSearchTool
 from ..utils.database import DatabaseManager
-from ..utils.guidelines import GuidelinesManager
+from ..utils.guidelines import GUIDELINES_TAG, GuidelinesManager
+from ..utils.json_utils import dumps_bytes, loads
 from ..utils.logger import get_logger, setup_logger
 from ..utils.model_metadata import ModelMetadataManager
 from ..utils.sandbox import Sandbox
-from .albert_manager import AlbertManager
 from .confirmation import ConfirmationManager
 from .editor import create_editor
-from .log_viewer import LogViewer
-from .model_selector import create_model_selector
-from .ollama_manager import OllamaManager
 from .prompt_manager import PromptManager
 
+# Backends, gestionnaires, tools Albert et rendus Rich lourds sont importés à la
+# demande (seul le backend configuré est chargé, et pas au lancement de la CLI)
+if TYPE_CHECKING:
+    from .albert_manager import AlbertManager
+    from .log_viewer import LogViewer
+    from .ollama_manager import OllamaManager
+
 logger = get_logger("agentichat.cli")
 
+# Commande "/" : nom (premier mot, "/" inclus) et arguments éventuels
+_CMD_RE = re.compile(r"^(/\S+)(?:\s+(.*))?$", re.DOTALL)
+
+# Heuristiques d'analyse des réponses (test /tools et détection d'explications) :
+# compilées une fois, elles tournent après chaque réponse du LLM
+_JSON_NAME_RE = re.compile(r'"name"\s*:\s*"[a-z_]+"')
+# Signaux forts d'une explication de tool (voir _tool_explanation_re)
+_EXPLANATION_SIGNALS = (
+    r'(?s:```[a-z]*\s*\{[^}]*"name"\s*:)',  # bloc JSON avec "name"
+    r'"name"\s*:\s*"[a-z_]+"\s*,\s*"(?:arguments|parameters)"',  # JSON en ligne
+    r'\.(?:group_by|sort_by|filter_by|sum|count)\s*\(',  # méthodes JS chaînées
+)
+# Mots-clés d'explication (une seule alternation)
+_EXPLAIN_RE = re.compile(
+    "|".join(
+        [
+            r'you (can|should|need to|must) (call|use|invoke)',
+            r'(appel|utilise|invoke)[a-z]* (le |la |l\')?tool',
+            r'voici (comment|un exemple)',
+            r'here.s (how|an example)',
+            r'function\s*\([^)]*\)\s*\{',  # code JS
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _tool_explanation_re(tool_names: frozenset[str]) -> re.Pattern[str]:
+    """Compile tous les signaux d'explication de tool en une seule regex.
+
+    Combine les signaux forts (_EXPLANATION_SIGNALS) et le motif "verbe
+    d'explication ... nom de tool" (ou l'inverse, insensible à la casse) :
+    une seule recherche parcourt la réponse.
+
+    Args:
+        tool_names: Noms des tools connus (peut être vide)
+
+    Returns:
+        Regex qui trouve une correspondance si l'un des signaux est présent
+    """
+    alternatives = list(_EXPLANATION_SIGNALS)
+    if tool_names:
+        names = "|".join(re.escape(name) for name in sorted(tool_names))
+        verbs = "(?:appel|utilis|invoke|call|use)"
+        alternatives.append(rf"(?i:{verbs}[a-z]* .*(?:{names})|(?:{names}).*{verbs})")
+    return re.compile("|".join(alternatives))
+
+
+@functools.lru_cache(maxsize=8)
+def _tool_names_re(tool_names: frozenset[str]) -> re.Pattern[str]:
+    """Compile une regex repérant les noms de tools en un seul parcours du texte.
+
+    Le lookahead renvoie, à chaque position, le plus long nom qui y commence
+    (les occurrences qui se chevauchent sont donc toutes vues).
+
+    Args:
+        tool_names: Noms des tools connus (non vide)
+
+    Returns:
+        Regex dont le groupe 1 est le nom trouvé
+    """
+    names = "|".join(re.escape(name) for name in sorted(tool_names, key=len, reverse=True))
+    return re.compile(f"(?=({names}))")
+
+
+@functools.lru_cache(maxsize=16)
+def _shorten_model(model: str, max_len: int = 40) -> str:
+    """Raccourcit un nom de modèle pour la barre de statut.
+
+    Retire le tag (":7b", ...) puis, si le nom reste trop long, garde le
+    préfixe (provider) et la fin, plus précise que le début.
+
+    Args:
+        model: Nom complet du modèle
+        max_len: Longueur maximale visée
+
+    Returns:
+        Nom raccourci
+    """
+    model_short = model.split(":")[0] if ":" in model else model
+
+    if len(model_short) > max_len:
+        # Garder le préfixe (provider) et la fin (version précise)
+        if "/" in model_short:
+            provider = model_short.split("/")[0]
+            # Calculer combien de caractères on peut garder pour la fin
+            remaining = max_len - len(provider) - 4  # -4 pour "/..."
+            suffix = model_short[-remaining:] if remaining > 0 else model_short[-10:]
+            model_short = f"{provider}/...{suffix}"
+        else:
+            # Pas de provider, juste garder la fin
+            model_short = "..." + model_short[-(max_len-3):]
+
+    return model_short
+
+
+# Échappement des crochets (balises Rich) en une seule passe
+_MARKUP_ESCAPES = str.maketrans({"[": "\\[", "]": "\\]"})
+
+
+def _escape_markup(text: str) -> str:
+    """Échappe les crochets d'un texte pour l'afficher sans interprétation Rich.
+
+    Args:
+        text: Texte brut (message d'erreur, extrait de réponse, ...)
+
+    Returns:
+        Texte avec "[" et "]" échappés
+    """
+    return text.translate(_MARKUP_ESCAPES)
+
+
+def _write_messages(path: Path, messages: list[Message], append: bool) -> None:
+    """Écrit des messages dans un fichier JSONL (bloquant, exécuté dans un thread).
+
+    Args:
+        path: Fichier de sauvegarde
+        messages: Messages à écrire
+        append: True pour ajouter en fin de fichier, False pour le réécrire
+            (atomiquement : fichier temporaire puis os.replace)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = b"".join(_encode_message(m) for m in messages)
+    if append:
+        with open(path, "ab") as f:
+            f.write(data)
+        return
+
+    # Une coupure pendant l'écriture laisse l'ancienne sauvegarde intacte
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _read_messages(path: Path) -> list[Message]:
+    """Lit les messages d'un fichier JSONL (bloquant, exécuté dans un thread).
+
+    Args:
+        path: Fichier de sauvegarde
+
+    Returns:
+        Messages dans l'ordre du fichier
+    """
+    with open(path, "rb") as f:
+        return [_decode_message(line) for line in f if line.strip()]
+
+
+def _migrate_pickled_conversation(legacy_path: Path, path: Path) -> None:
+    """Convertit une sauvegarde pickle (anciennes versions) au format JSONL.
+
+    Le fichier pickle est supprimé une fois la conversion écrite.
+
+    Args:
+        legacy_path: Ancienne sauvegarde (conversation.pkl)
+        path: Nouvelle sauvegarde JSONL
+    """
+    import pickle
+
+    with open(legacy_path, "rb") as f:
+        messages = pickle.load(f)
+    if not isinstance(messages, list):
+        raise ValueError("Invalid conversation file format")
+    _write_messages(path, messages, append=False)
+    legacy_path.unlink()
+
+
+# Tools enregistrés pour tous les backends, par type de constructeur
+_SANDBOX_TOOLS = (
+    # Fichiers
+    ListFilesTool,
+    ReadFileTool,
+    WriteFileTool,
+    DeleteFileTool,
+    SearchTextTool,
+    GlobTool,
+    # Répertoires
+    CreateDirectoryTool,
+    DeleteDirectoryTool,
+    MoveFileTool,
+    CopyFileTool,
+    # Système
+    ShellExecTool,
+)
+_WEB_TOOLS = (WebFetchTool, WebSearchTool)
+
+# Commandes qui quittent la boucle principale
+_QUIT_COMMANDS = frozenset({"/quit", "/exit", "/q", "/bye"})
+
+# Aide affichée au démarrage quand aucun backend n'est configuré (un seul rendu)
+_NO_BACKEND_HELP = """
+[bold red]Erreur:[/bold red] Aucun backend configuré
+
+[dim]Agentichat a besoin d'un backend LLM pour fonctionner.[/dim]
+
+[bold]Configuration rapide:[/bold]
+  1. Copier le fichier de configuration exemple:
+     [cyan]cp config.example.yaml ~/.agentichat/config.yaml[/cyan]
+
+  2. Pour Ollama (local):
+     - Installer Ollama: [cyan]https://ollama.ai[/cyan]
+     - Télécharger un modèle: [cyan]ollama pull qwen2.5-coder:7b[/cyan]
+     - La config par défaut devrait fonctionner
+
+  3. Pour Albert (API Etalab):
+     - Copier: [cyan]cp config.albert.example.yaml ~/.agentichat/config.yaml[/cyan]
+     - Obtenir une clé: [cyan]https://albert.api.etalab.gouv.fr[/cyan]
+     - Éditer ~/.agentichat/config.yaml et mettre votre clé
+"""
+
+
+def _encode_message(msg: Message) -> bytes:
+    """Sérialise un message en une ligne JSONL (champs vides omis).
+
+    Args:
+        msg: Message à sérialiser
+
+    Returns:
+        Ligne JSON terminée par un saut de ligne
+    """
+    record: dict = {"role": msg.role, "content": msg.content}
+    if msg.tool_calls:
+        record["tool_calls"] = [
+            {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
+            for tc in msg.tool_calls
+        ]
+    if msg.tool_call_id is not None:
+        record["tool_call_id"] = msg.tool_call_id
+    return dumps_bytes(record) + b"\n"
+
+
+def _decode_message(line: bytes) -> Message:
+    """Reconstruit un message depuis une ligne JSONL écrite par _encode_message.
+
+    Args:
+        line: Ligne JSON
+
+    Returns:
+        Message correspondant
+    """
+    record = loads(line)
+    tool_calls = record.get("tool_calls")
+    return Message(
+        role=record["role"],
+        content=record["content"],
+        tool_calls=[ToolCall(**tc) for tc in tool_calls] if tool_calls else None,
+        tool_call_id=record.get("tool_call_id"),
+    )
+
 
 class ChatApp:
     """Application CLI de chat avec LLM."""
@@ -68,16 +318,31 @@ class ChatApp:
         self.debug_mode = False
         self.console = Console()
         self.messages: list[Message] = []
+        self._conv_file = config.data_dir / "conversation.jsonl"  # Sauvegarde (/save)
+        # Messages déjà écrits dans le fichier de sauvegarde (dans l'ordre) : /save
+        # n'ajoute que les suivants tant qu'ils restent un préfixe de self.messages
+        self._saved_messages: list[Message] = []
         self.backend: Backend | None = None
         self.sandbox: Sandbox | None = None
         self.registry: ToolRegistry | None = None
         self.agent: AgentLoop | None = None
         self.confirmation_manager: ConfirmationManager | None = None
-        self.model_metadata = ModelMetadataManager(config.config_dir)  # Global
+        self._model_metadata: ModelMetadataManager | None = None  # Global (voir model_metadata)
 
         # Créer le gestionnaire de base de données (local au projet)
         db_path = config.data_dir / "agentichat.db"
         self.db = DatabaseManager(db_path)
+        # Les messages sont écrits en base par une tâche de fond, par lots, pour ne
+        # pas retarder le tour de conversation (voir _db_writer) ; chaque élément
+        # de la file est la liste des messages d'une même étape du tour
+        self._db_queue: asyncio.Queue[list[Message]] = asyncio.Queue()
+        self._db_task: asyncio.Task | None = None
+
+        # Barre de statut : prompt_toolkit la redemande à chaque frappe, elle n'est
+        # reconstruite que si l'état affiché change (clé d'état, texte)
+        self._toolbar_cache: tuple[tuple, str] | None = None
+        # Nom court du workspace : le répertoire courant ne change pas en session
+        self._workspace_name = Path.cwd().name or "/"
 
         # Créer l'éditeur avec historique, bottom toolbar ET callback Shift+Tab
         history_file = config.data_dir / "history.txt"
@@ -87,13 +352,16 @@ class ChatApp:
             on_shift_tab=self._cycle_confirmation_mode
         )
 
-        # Créer le visualiseur de logs
-        log_file = config.data_dir / "agentichat.log"
-        self.log_viewer = LogViewer(log_file)
+        # Session de saisie des questions oui/non (sans historique, distincte de
+        # l'éditeur principal), créée à la première question
+        self._answer_session: PromptSession | None = None
+
+        # Visualiseur de logs, créé à la première commande /log
+        self._log_viewer: "LogViewer | None" = None
 
         # Créer les gestionnaires de backends (seront initialisés avec leurs URLs)
-        self.ollama_manager: OllamaManager | None = None
-        self.albert_manager: AlbertManager | None = None
+        self.ollama_manager: "OllamaManager | None" = None
+        self.albert_manager: "AlbertManager | None" = None
 
         # Créer le gestionnaire de prompt
         self.prompt_manager = PromptManager(self.console)
@@ -101,22 +369,105 @@ class ChatApp:
         # Créer le gestionnaire de guidelines (sera initialisé avec backend)
         self.guidelines_manager: GuidelinesManager | None = None
 
+        # Table de dispatch des commandes "/" (voir _dispatch_command) :
+        # - commandes exactes (saisie complète), handler sans argument
+        # - commandes à préfixe (premier mot), handler recevant la saisie complète
+        self._exact_commands: dict[str, Callable[[], Any]] = {
+            "/clear": self._handle_clear_command,
+            "/save": self._save_conversation,
+            "/model": self._handle_model_command,
+            "/info": self._handle_info_command,
+            "/compile": self._handle_compile_command,
+        }
+        self._prefix_commands: dict[str, Callable[[str], Any]] = {
+            "/history": self._handle_history_command,
+            "/help": self._show_help,
+            "/config": self._handle_config_command,
+            "/log": self._handle_log_command,
+            "/ollama": self._handle_ollama_command,
+            "/albert": self._handle_albert_command,
+            "/prompt": self._handle_prompt_command,
+            "/compress": self._handle_compress_command,
+            "/tools": self._handle_tools_command,
+            "/!": self._handle_shell_command,
+        }
+
+    @property
+    def model_metadata(self) -> ModelMetadataManager:
+        """Metadata des modèles, chargées depuis le disque au premier usage."""
+        if self._model_metadata is None:
+            self._model_metadata = ModelMetadataManager(self.config.config_dir)
+        return self._model_metadata
+
+    @property
+    def log_viewer(self) -> "LogViewer":
+        """Visualiseur du fichier de logs, créé au premier usage."""
+        if self._log_viewer is None:
+            from .log_viewer import LogViewer
+
+            self._log_viewer = LogViewer(self.config.data_dir / "agentichat.log")
+        return self._log_viewer
+
+    async def _ask(self, question: str) -> str:
+        """Pose une question à l'utilisateur sans bloquer la boucle asyncio.
+
+        Contrairement à input(), les tâches de fond (écritures en base,
+        keep-alive HTTP) continuent de tourner pendant l'attente.
+
+        Args:
+            question: Texte affiché devant la saisie
+
+        Returns:
+            Réponse saisie, sans espaces autour
+
+        Raises:
+            EOFError: Si l'utilisateur quitte (Ctrl+D)
+            KeyboardInterrupt: Si l'utilisateur annule (Ctrl+C)
+        """
+        if self._answer_session is None:
+            self._answer_session = PromptSession()
+        response = await self._answer_session.prompt_async(question)
+        return response.strip()
+
+    @staticmethod
+    def _create_albert_tools(url: str, api_key: str | None) -> list[Tool]:
+        """Crée les tools propres au backend Albert (import à la demande).
+
+        Args:
+            url: URL de l'API Albert
+            api_key: Clé API Albert
+
+        Returns:
+            Tools recherche, OCR, transcription et embeddings
+        """
+        from ..tools.albert_tools import (
+            AlbertEmbeddingsTool,
+            AlbertOCRTool,
+            AlbertSearchTool,
+            AlbertTranscriptionTool,
+        )
+
+        return [
+            tool_cls(url, api_key)
+            for tool_cls in (
+                AlbertSearchTool,
+                AlbertOCRTool,
+                AlbertTranscriptionTool,
+                AlbertEmbeddingsTool,
+            )
+        ]
+
     async def initialize(self) -> None:
         """Initialise l'application (backend, tools, etc.)."""
         # Créer le répertoire de données si nécessaire
         self.config.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialiser la base de données
-        await self.db.initialize()
-
         # Initialiser le logger
         log_level = "DEBUG" if self.debug_mode else "INFO"
         log_file = self.config.data_dir / "agentichat.log"
+        # Un seul logger configuré : les loggers "agentichat.*" héritent de son
+        # niveau et lui propagent leurs messages (pas de handlers en double)
         setup_logger("agentichat", level=log_level, log_file=log_file)
-        setup_logger("agentichat.cli", level=log_level, log_file=log_file)
-        setup_logger("agentichat.backends.ollama", level=log_level, log_file=log_file)
-        setup_logger("agentichat.backends.albert", level=log_level, log_file=log_file)
-        setup_logger("agentichat.core.agent", level=log_level, log_file=log_file)
 
         if self.debug_mode:
             self.console.print(f"[dim]Mode debug activé. Logs: {log_file}[/dim]")
@@ -125,23 +476,7 @@ class ChatApp:
 
         # Vérifier qu'au moins un backend est configuré
         if not self.config.backends:
-            self.console.print(
-                "\n[bold red]Erreur:[/bold red] Aucun backend configuré\n"
-            )
-            self.console.print(
-                "[dim]Agentichat a besoin d'un backend LLM pour fonctionner.[/dim]\n"
-            )
-            self.console.print("[bold]Configuration rapide:[/bold]")
-            self.console.print("  1. Copier le fichier de configuration exemple:")
-            self.console.print("     [cyan]cp config.example.yaml ~/.agentichat/config.yaml[/cyan]\n")
-            self.console.print("  2. Pour Ollama (local):")
-            self.console.print("     - Installer Ollama: [cyan]https://ollama.ai[/cyan]")
-            self.console.print("     - Télécharger un modèle: [cyan]ollama pull qwen2.5-coder:7b[/cyan]")
-            self.console.print("     - La config par défaut devrait fonctionner\n")
-            self.console.print("  3. Pour Albert (API Etalab):")
-            self.console.print("     - Copier: [cyan]cp config.albert.example.yaml ~/.agentichat/config.yaml[/cyan]")
-            self.console.print("     - Obtenir une clé: [cyan]https://albert.api.etalab.gouv.fr[/cyan]")
-            self.console.print("     - Éditer ~/.agentichat/config.yaml et mettre votre clé\n")
+            self.console.print(_NO_BACKEND_HELP)
             return
 
         # Initialiser le backend par défaut
@@ -171,6 +506,8 @@ class ChatApp:
 
         # Instancier le backend selon le type
         if backend_config.type == "ollama":
+            from ..backends.ollama import OllamaBackend
+
             self.backend = OllamaBackend(
                 url=backend_config.url,
                 model=backend_config.model,
@@ -178,8 +515,14 @@ class ChatApp:
                 max_tokens=backend_config.max_tokens,
                 temperature=backend_config.temperature,
                 max_parallel_tools=max_parallel_tools,
+                connector_limit=backend_config.connector_limit,
+                connector_limit_per_host=backend_config.connector_limit_per_host,
+                max_parallel_requests=backend_config.max_parallel_requests,
+                transport=backend_config.transport,
             )
         elif backend_config.type == "albert":
+            from ..backends.albert import AlbertBackend
+
             self.backend = AlbertBackend(
                 url=backend_config.url,
                 model=backend_config.model,
@@ -188,6 +531,9 @@ class ChatApp:
                 max_tokens=backend_config.max_tokens,
                 temperature=backend_config.temperature,
                 max_parallel_tools=max_parallel_tools,
+                connector_limit=backend_config.connector_limit,
+                connector_limit_per_host=backend_config.connector_limit_per_host,
+                max_parallel_requests=backend_config.max_parallel_requests,
             )
         else:
             self.console.print(
@@ -196,9 +542,16 @@ class ChatApp:
             )
             return
 
-        # Vérifier la connexion
+        # Vérifier la connexion, pendant l'initialisation de la base de données
+        # (aiosqlite travaille dans son propre thread) et le chargement de
+        # l'encodage tiktoken (qui peut télécharger son fichier BPE)
         self.console.print(f"[dim]Connexion à {backend_config.url}...[/dim]")
-        if not await self.backend.health_check():
+        healthy, _, _ = await asyncio.gather(
+            self.backend.health_check(),
+            self.db.initialize(),
+            asyncio.to_thread(load_token_encoding),
+        )
+        if not healthy:
             self.console.print(
                 f"[bold red]Erreur:[/bold red] Impossible de se connecter à "
                 f"{backend_config.url}"
@@ -213,15 +566,21 @@ class ChatApp:
 
         # Initialiser les gestionnaires de backends
         if backend_config.type == "ollama":
+            from .ollama_manager import OllamaManager
+
             self.ollama_manager = OllamaManager(
                 url=backend_config.url, timeout=backend_config.timeout
             )
         elif backend_config.type == "albert":
+            from .albert_manager import AlbertManager
+
             self.albert_manager = AlbertManager(
                 url=backend_config.url,
                 api_key=backend_config.api_key,
                 timeout=backend_config.timeout,
+                transport=backend_config.transport,
             )
+            self.albert_manager.start_warmup()  # Connexion ouverte en arrière-plan
 
         # Initialiser le sandbox
         workspace_root = Path.cwd()
@@ -235,50 +594,25 @@ class ChatApp:
         )
         self.console.print(f"[dim]Workspace: {workspace_root}[/dim]")
 
-        # Initialiser le registre des tools
+        # Initialiser le registre des tools (fichiers, système, web, productivité)
         self.registry = ToolRegistry()
-
-        # Enregistrer les tools - Fichiers
-        self.registry.register(ListFilesTool(self.sandbox))
-        self.registry.register(ReadFileTool(self.sandbox))
-        self.registry.register(WriteFileTool(self.sandbox))
-        self.registry.register(DeleteFileTool(self.sandbox))
-        self.registry.register(SearchTextTool(self.sandbox))
-        self.registry.register(GlobTool(self.sandbox))
-
-        # Enregistrer les tools - Répertoires
-        self.registry.register(CreateDirectoryTool(self.sandbox))
-        self.registry.register(DeleteDirectoryTool(self.sandbox))
-        self.registry.register(MoveFileTool(self.sandbox))
-        self.registry.register(CopyFileTool(self.sandbox))
-
-        # Enregistrer les tools - Système
-        self.registry.register(ShellExecTool(self.sandbox))
-
-        # Enregistrer les tools - Web
-        self.registry.register(WebFetchTool())
-        self.registry.register(WebSearchTool())
-
-        # Enregistrer les tools - Productivité
-        self.registry.register(TodoWriteTool(self.config.data_dir))
+        sandbox = self.sandbox
+        self.registry.register_many(
+            [
+                *(tool_cls(sandbox) for tool_cls in _SANDBOX_TOOLS),
+                *(tool_cls() for tool_cls in _WEB_TOOLS),
+                TodoWriteTool(self.config.data_dir),
+            ]
+        )
 
         # Enregistrer les tools - Albert (si backend Albert)
         if backend_config.type == "albert":
-            self.registry.register(
-                AlbertSearchTool(backend_config.url, backend_config.api_key)
-            )
-            self.registry.register(
-                AlbertOCRTool(backend_config.url, backend_config.api_key)
-            )
-            self.registry.register(
-                AlbertTranscriptionTool(backend_config.url, backend_config.api_key)
-            )
-            self.registry.register(
-                AlbertEmbeddingsTool(backend_config.url, backend_config.api_key)
+            self.registry.register_many(
+                self._create_albert_tools(backend_config.url, backend_config.api_key)
             )
             self.console.print("[dim]+ 4 tools Albert ajoutés[/dim]")
 
-        tools_count = len(self.registry.list_tools())
+        tools_count = len(self.registry.tool_names())
         self.console.print(f"[dim]{tools_count} tools disponibles[/dim]")
 
         # Initialiser le gestionnaire de confirmation
@@ -290,10 +624,8 @@ class ChatApp:
             backend=self.backend
         )
 
-        # Vérifier et charger les guidelines si disponibles
-        await self._check_and_load_guidelines()
-
-        # Vérifier que le modèle configuré existe
+        # Vérifier que le modèle configuré existe (peut ouvrir le sélecteur de
+        # modèle) avant les guidelines, dont la compilation appelle ce modèle
         if not await self._verify_model():
             self.console.print(
                 "[bold red]Erreur:[/bold red] Impossible de démarrer sans modèle valide"
@@ -301,6 +633,12 @@ class ChatApp:
             self.backend = None
             return
 
+        # Vérifier et charger les guidelines si disponibles
+        await self._check_and_load_guidelines()
+
+        # Backend utilisable : démarrer l'écriture des messages en base
+        self._db_task = asyncio.create_task(self._db_writer())
+
         # Initialiser l'agent
         self.agent = AgentLoop(
             backend=self.backend,
@@ -322,6 +660,8 @@ class ChatApp:
         if not self.backend:
             return False
 
+        from ..backends.albert import AlbertBackend
+
         # Pour Albert et autres backends API, on suppose que le modèle est valide
         # La vérification se fera lors de la première requête
         if isinstance(self.backend, AlbertBackend):
@@ -364,6 +704,8 @@ class ChatApp:
         )
 
         # Proposer la sélection interactive
+        from .model_selector import create_model_selector
+
         selector = create_model_selector(self.console)
         selected_model = await selector.select_model(models)
 
@@ -431,49 +773,73 @@ class ChatApp:
 
         system_message = self.guidelines_manager.get_system_message()
         if system_message:
-            # Supprimer l'ancien message de guidelines s'il existe
-            self.messages = [
-                m for m in self.messages
-                if not (m.role == "system" and "[User Project Guidelines]" in m.content)
-            ]
-
-            # Insérer en premier
-            self.messages.insert(0, system_message)
+            # Cas courant : les guidelines déjà injectées sont le premier message,
+            # remplacé sur place (sans parcourir tout l'historique)
+            if (
+                self.messages
+                and self.messages[0].role == "system"
+                and self.messages[0].content.startswith(GUIDELINES_TAG)
+            ):
+                self.messages[0] = system_message
+            else:
+                # Supprimer l'ancien message de guidelines s'il existe ailleurs
+                self.messages = [
+                    m for m in self.messages
+                    if not (m.role == "system" and GUIDELINES_TAG in m.content)
+                ]
+
+                # Insérer en premier
+                self.messages.insert(0, system_message)
             logger.info("Guidelines injected into conversation")
 
     def _get_conversation_file(self) -> Path:
         """Retourne le chemin du fichier de sauvegarde de conversation.
 
         Returns:
-            Path vers conversation.pkl
+            Path vers conversation.jsonl
         """
-        return self.config.data_dir / "conversation.pkl"
+        return self._conv_file
+
+    async def _save_conversation(self) -> None:
+        """Sauvegarde la conversation dans un fichier JSONL (un message par ligne).
 
-    def _save_conversation(self) -> None:
-        """Sauvegarde la conversation dans un fichier."""
+        Si la dernière sauvegarde est toujours le début de la conversation, seuls
+        les nouveaux messages sont ajoutés en fin de fichier ; sinon (après
+        /compress, /clear, ...) le fichier est réécrit.
+        """
         conv_file = self._get_conversation_file()
 
         try:
-            # Créer le répertoire si nécessaire
-            conv_file.parent.mkdir(parents=True, exist_ok=True)
+            messages = list(self.messages)  # Instantané : la liste peut changer pendant l'écriture
+            saved = self._saved_messages
+            append = bool(
+                saved
+                and len(saved) <= len(messages)
+                and all(a is b for a, b in zip(saved, messages))
+                and conv_file.exists()
+            )
+            new_messages = messages[len(saved):] if append else messages
 
-            # Sauvegarder avec pickle
-            with open(conv_file, "wb") as f:
-                pickle.dump(self.messages, f)
+            # Écriture dans un thread : la boucle asyncio n'est pas bloquée
+            await asyncio.to_thread(_write_messages, conv_file, new_messages, append)
+            self._saved_messages = messages
 
-            logger.info(f"Conversation saved to {conv_file} ({len(self.messages)} messages)")
+            logger.info(
+                f"Conversation saved to {conv_file} ({len(self.messages)} messages, "
+                f"{len(new_messages)} written)"
+            )
             self.console.print(
                 f"[bold green]✓[/bold green] Discussion sauvegardée "
                 f"({len(self.messages)} messages)\n"
             )
         except Exception as e:
-            error_display = str(e).replace("[", "\\[").replace("]", "\\]")
+            error_display = _escape_markup(str(e))
             self.console.print(
                 f"[bold red]Erreur lors de la sauvegarde:[/bold red] {error_display}\n"
             )
             logger.error(f"Failed to save conversation: {e}")
 
-    def _load_conversation(self) -> bool:
+    async def _load_conversation(self) -> bool:
         """Charge la conversation sauvegardée si elle existe.
 
         Returns:
@@ -482,24 +848,27 @@ class ChatApp:
         conv_file = self._get_conversation_file()
 
         if not conv_file.exists():
-            logger.debug("No saved conversation found")
-            return False
+            legacy_file = conv_file.with_suffix(".pkl")
+            if not legacy_file.exists():
+                logger.debug("No saved conversation found")
+                return False
+            # Sauvegarde d'une version précédente (pickle) : convertie une fois
+            try:
+                await asyncio.to_thread(_migrate_pickled_conversation, legacy_file, conv_file)
+                logger.info(f"Migrated {legacy_file} to {conv_file}")
+            except Exception as e:
+                logger.error(f"Failed to migrate legacy conversation: {e}")
+                return False
 
         try:
-            with open(conv_file, "rb") as f:
-                loaded_messages = pickle.load(f)
-
-            # Vérifier que c'est bien une liste de messages
-            if not isinstance(loaded_messages, list):
-                logger.warning("Invalid conversation file format")
-                return False
+            loaded_messages = await asyncio.to_thread(_read_messages, conv_file)
 
             self.messages = loaded_messages
+            self._saved_messages = list(loaded_messages)
             logger.info(f"Conversation loaded from {conv_file} ({len(self.messages)} messages)")
 
-            # Calculer la taille approximative
-            total_chars = sum(len(m.content or "") for m in self.messages)
-            size_kb = total_chars / 1024
+            # Taille approximative : celle du fichier (un stat, sans parcourir les messages)
+            size_kb = conv_file.stat().st_size / 1024
 
             self.console.print(
                 f"[bold cyan]Récupération de la discussion[/bold cyan] "
@@ -521,6 +890,7 @@ class ChatApp:
         if conv_file.exists():
             try:
                 conv_file.unlink()
+                self._saved_messages = []
                 logger.info("Saved conversation deleted")
             except Exception as e:
                 logger.error(f"Failed to delete conversation file: {e}")
@@ -546,7 +916,7 @@ class ChatApp:
         )
 
         # Charger la conversation sauvegardée si elle existe
-        self._load_conversation()
+        await self._load_conversation()
 
         # Boucle principale
         while True:
@@ -564,106 +934,10 @@ class ChatApp:
                     continue
 
                 # Vérifier les commandes spéciales
-                if user_input in ["/quit", "/exit", "/q", "/bye"]:
+                if user_input in _QUIT_COMMANDS:
                     break
 
-                if user_input == "/clear":
-                    # Vérifier si une sauvegarde existe
-                    conv_file = self._get_conversation_file()
-                    delete_save = False
-
-                    if conv_file.exists():
-                        self.console.print(
-                            "[yellow]Une discussion sauvegardée existe.[/yellow]\n"
-                            "[dim]Voulez-vous la supprimer ? (Y/n):[/dim] ",
-                            end=""
-                        )
-                        response = input().strip()
-                        delete_save = response.lower() not in ["n", "no", "non"]
-
-                    # Effacer les messages
-                    self.messages = []
-
-                    # Réinitialiser aussi le mode passthrough (nouvelle conversation)
-                    if self.confirmation_manager:
-                        self.confirmation_manager.reset_passthrough()
-
-                    # Supprimer la sauvegarde si demandé
-                    if delete_save:
-                        self._delete_conversation()
-                        self.console.print("[dim]Conversation et sauvegarde supprimées[/dim]\n")
-                    else:
-                        self.console.print("[dim]Conversation réinitialisée (sauvegarde conservée)[/dim]\n")
-
-                    # Ré-injecter les guidelines si disponibles
-                    await self._inject_guidelines()
-                    continue
-
-                if user_input == "/save":
-                    self._save_conversation()
-                    continue
-
-                if user_input.startswith("/history"):
-                    self._handle_history_command(user_input)
-                    continue
-
-                if user_input.startswith("/help"):
-                    self._show_help(user_input)
-                    continue
-
-                # Commande /config
-                if user_input.startswith("/config"):
-                    await self._handle_config_command(user_input)
-                    continue
-
-                # Commande /log
-                if user_input.startswith("/log"):
-                    self._handle_log_command(user_input)
-                    continue
-
-                # Commande /ollama
-                if user_input.startswith("/ollama"):
-                    await self._handle_ollama_command(user_input)
-                    continue
-
-                # Commande /albert
-                if user_input.startswith("/albert"):
-                    await self._handle_albert_command(user_input)
-                    continue
-
-                # Commande /prompt
-                if user_input.startswith("/prompt"):
-                    self._handle_prompt_command(user_input)
-                    continue
-
-                # Commande /model
-                if user_input == "/model":
-                    self._handle_model_command()
-                    continue
-
-                # Commande /info
-                if user_input == "/info":
-                    await self._handle_info_command()
-                    continue
-
-                # Commande /compress
-                if user_input.startswith("/compress"):
-                    await self._handle_compress_command(user_input)
-                    continue
-
-                # Commande /compile
-                if user_input == "/compile":
-                    await self._handle_compile_command()
-                    continue
-
-                # Commande /tools
-                if user_input.startswith("/tools"):
-                    await self._handle_tools_command(user_input)
-                    continue
-
-                # Commande /! pour exécuter directement une commande shell
-                if user_input.startswith("/!"):
-                    await self._handle_shell_command(user_input)
+                if user_input.startswith("/") and await self._dispatch_command(user_input):
                     continue
 
                 # Note: Le mode passthrough (Always) persiste pour toute la session
@@ -673,8 +947,8 @@ class ChatApp:
                 user_message = Message(role="user", content=user_input)
                 self.messages.append(user_message)
 
-                # Sauvegarder le message dans la base de données
-                await self.db.save_message(user_message)
+                # Sauvegarder le message dans la base de données (en arrière-plan)
+                self._db_queue.put_nowait([user_message])
 
                 # Vérifier si un avertissement de compression est nécessaire
                 await self._check_compression_warning()
@@ -691,7 +965,7 @@ class ChatApp:
                 continue
             except Exception as e:
                 # Échapper le message d'erreur pour éviter les conflits de markup
-                error_msg = str(e).replace("[", "\\[").replace("]", "\\]")
+                error_msg = _escape_markup(str(e))
                 self.console.print(f"\n[bold red]Erreur:[/bold red] {error_msg}")
                 self.console.print("[dim]Vous pouvez continuer avec une nouvelle commande[/dim]\n")
                 logger.error(f"Unexpected error in main loop: {e}", exc_info=True)
@@ -699,12 +973,103 @@ class ChatApp:
 
         self.console.print("\n[dim]Au revoir ![/dim]")
 
+        # Terminer les écritures en base en attente
+        if self._db_task:
+            await self._db_queue.join()
+            self._db_task.cancel()
+
         # Fermer proprement la session HTTP du backend si nécessaire
         if self.backend and hasattr(self.backend, "close"):
             try:
                 await self.backend.close()
             except Exception:
                 pass
+        if self.albert_manager:
+            try:
+                await self.albert_manager.close()
+            except Exception:
+                pass
+
+    async def _db_writer(self) -> None:
+        """Tâche de fond : écrit en base les messages mis dans self._db_queue.
+
+        Les listes arrivées pendant une écriture sont regroupées dans la
+        suivante (une seule transaction par lot). Les erreurs sont journalisées
+        sans interrompre la conversation.
+        """
+        queue = self._db_queue
+        while True:
+            entries = [await queue.get()]
+            while not queue.empty():
+                entries.append(queue.get_nowait())
+            batch = [msg for entry in entries for msg in entry]
+            try:
+                await self.db.save_messages(batch)
+            except Exception as e:
+                logger.error(f"Failed to save {len(batch)} message(s) to database: {e}")
+            finally:
+                for _ in entries:
+                    queue.task_done()
+
+    async def _dispatch_command(self, user_input: str) -> bool:
+        """Exécute la commande "/" correspondant à la saisie, s'il y en a une.
+
+        Recherche d'abord la saisie complète parmi les commandes exactes, puis
+        son premier mot parmi les commandes à préfixe ; les saisies collées à
+        leur commande (ex: "/!ls") sont rattrapées par un parcours des préfixes.
+
+        Args:
+            user_input: Saisie de l'utilisateur (commençant par "/")
+
+        Returns:
+            True si une commande a été exécutée, False sinon (message pour le LLM)
+        """
+        handler = self._exact_commands.get(user_input)
+        if handler is not None:
+            result = handler()
+        else:
+            match = _CMD_RE.match(user_input)
+            prefix_handler = self._prefix_commands.get(match.group(1)) if match else None
+            if prefix_handler is None:
+                prefix_handler = next(
+                    (h for p, h in self._prefix_commands.items() if user_input.startswith(p)),
+                    None,
+                )
+                if prefix_handler is None:
+                    return False
+            result = prefix_handler(user_input)
+
+        if inspect.isawaitable(result):
+            await result
+        return True
+
+    async def _handle_clear_command(self) -> None:
+        """Réinitialise la conversation (commande /clear)."""
+        # Vérifier si une sauvegarde existe
+        conv_file = self._get_conversation_file()
+        delete_save = False
+
+        if conv_file.exists():
+            self.console.print("[yellow]Une discussion sauvegardée existe.[/yellow]")
+            response = await self._ask("Voulez-vous la supprimer ? (Y/n): ")
+            delete_save = response.lower() not in ["n", "no", "non"]
+
+        # Effacer les messages
+        self.messages = []
+
+        # Réinitialiser aussi le mode passthrough (nouvelle conversation)
+        if self.confirmation_manager:
+            self.confirmation_manager.reset_passthrough()
+
+        # Supprimer la sauvegarde si demandé
+        if delete_save:
+            self._delete_conversation()
+            self.console.print("[dim]Conversation et sauvegarde supprimées[/dim]\n")
+        else:
+            self.console.print("[dim]Conversation réinitialisée (sauvegarde conservée)[/dim]\n")
+
+        # Ré-injecter les guidelines si disponibles
+        await self._inject_guidelines()
 
     async def _check_compression_warning(self) -> None:
         """Vérifie et affiche un avertissement si la compression est recommandée.
@@ -715,13 +1080,20 @@ class ChatApp:
         compress_config = self.config.compression
 
         # Si pas de seuil configuré, pas d'avertissement
-        if not compress_config.auto_threshold:
+        threshold = compress_config.auto_threshold
+        if not threshold:
             return
 
         message_count = len(self.messages)
-        threshold = compress_config.auto_threshold
         warning_pct = compress_config.warning_threshold
 
+        # Cas courant (appelé à chaque tour) : aucun seuil atteint, rien à faire
+        max_messages = compress_config.max_messages if compress_config.auto_enabled else None
+        if message_count < threshold * warning_pct and not (
+            max_messages and message_count >= max_messages
+        ):
+            return
+
         # Calculer le pourcentage
         if threshold > 0:
             current_pct = message_count / threshold
@@ -767,11 +1139,11 @@ class ChatApp:
         if not (self.backend and hasattr(self.backend, 'cumulative_usage')):
             return
         cum = self.backend.cumulative_usage
-        total_tokens = cum.get("total_tokens", 0)
+        total_tokens = cum.total_tokens
         if total_tokens > 0:
-            prompt_tokens = cum.get("prompt_tokens", 0)
-            completion_tokens = cum.get("completion_tokens", 0)
-            api_calls = cum.get("api_calls", 0)
+            prompt_tokens = cum.prompt_tokens
+            completion_tokens = cum.completion_tokens
+            api_calls = cum.api_calls
             calls_info = f" │ {api_calls} appel{'s' if api_calls > 1 else ''} API" if api_calls > 1 else ""
             self.console.print(
                 f"\n[dim]Terminé en {elapsed_total:.1f}s │ "
@@ -791,11 +1163,13 @@ class ChatApp:
             if not tools:
                 self.console.print("[yellow]Aucun tool disponible.[/yellow]")
                 return
-            self.console.print(f"\n[bold]Tools disponibles ({len(tools)} au total):[/bold]\n")
+            # Une seule impression (un seul rendu Rich) pour toute la liste
+            lines = [f"\n[bold]Tools disponibles ({len(tools)} au total):[/bold]\n"]
             for tool in sorted(tools, key=lambda t: t.name):
                 desc = f"  [dim]{tool.description[:70]}[/dim]" if tool.description else ""
-                self.console.print(f"  [cyan]{tool.name}[/cyan]{desc}")
-            self.console.print()
+                lines.append(f"  [cyan]{tool.name}[/cyan]{desc}")
+            lines.append("")
+            self.console.print("\n".join(lines))
 
         elif subcommand == "test":
             await self._test_tool_support()
@@ -812,7 +1186,7 @@ class ChatApp:
         if not self.backend:
             self.console.print("[red]Pas de backend actif.[/red]")
             return
-        if not self.registry.list_tools():
+        if not self.registry.tool_names():
             self.console.print("[red]Aucun tool enregistré.[/red]")
             return
 
@@ -841,7 +1215,7 @@ class ChatApp:
             self.console.print(f"[red]Erreur réseau pendant le test: {e}[/red]")
             return
 
-        known_tools = {t.name for t in self.registry.list_tools()}
+        known_tools = self.registry.tool_names()
         level = self._analyze_tool_response(response1, expected_tool="list_files", known_tools=known_tools)
 
         # Test 2 : question sur les tools disponibles (doit répondre en texte)
@@ -860,11 +1234,12 @@ class ChatApp:
             response2 = None
 
         # Compter combien de nos tools sont cités dans la réponse
+        # (un seul parcours ; un nom contenu dans un nom plus long trouvé compte aussi)
         tools_cited = 0
-        if response2 and response2.content:
-            for tool_name in known_tools:
-                if tool_name in response2.content:
-                    tools_cited += 1
+        if response2 and response2.content and known_tools:
+            pattern = _tool_names_re(known_tools)
+            found = {m.group(1) for m in pattern.finditer(response2.content)}
+            tools_cited = sum(1 for name in known_tools if any(name in f for f in found))
 
         # Afficher les résultats
         self.console.print()
@@ -900,7 +1275,9 @@ class ChatApp:
             )
             # Montrer un extrait de la réponse
             if response1.content:
-                excerpt = response1.content[:300].replace("[", "\\[").replace("]", "\\]")
+                from rich.panel import Panel
+
+                excerpt = _escape_markup(response1.content[:300])
                 self.console.print(Panel(excerpt + "...", title="Extrait réponse", border_style="red"))
         else:
             self.console.print("[bold red]❌ TEST 1 — NIVEAU E : Aucun tool utilisé[/bold red]")
@@ -944,7 +1321,7 @@ class ChatApp:
         self.console.print()
 
     @staticmethod
-    def _analyze_tool_response(response, expected_tool: str, known_tools: set) -> str:
+    def _analyze_tool_response(response, expected_tool: str, known_tools: frozenset[str]) -> str:
         """Analyse la réponse du modèle lors d'un test de tool calling.
 
         Returns:
@@ -962,22 +1339,15 @@ class ChatApp:
         # Pas de tool calls : détecter si le modèle explique au lieu d'agir
         content = response.content or ""
         # JSON avec "name" dans le texte = tentative d'explication de tool call
-        if re.search(r'"name"\s*:\s*"[a-z_]+"', content):
+        if _JSON_NAME_RE.search(content):
             return "D"
         # Mots-clés d'explication
-        explain_patterns = [
-            r'you (can|should|need to|must) (call|use|invoke)',
-            r'(appel|utilise|invoke)[a-z]* (le |la |l\')?tool',
-            r'voici (comment|un exemple)',
-            r'here.s (how|an example)',
-            r'function\s*\([^)]*\)\s*\{',  # code JS
-        ]
-        if any(re.search(p, content, re.IGNORECASE) for p in explain_patterns):
+        if _EXPLAIN_RE.search(content):
             return "D"
         return "E"
 
     @staticmethod
-    def _looks_like_tool_explanation(response_text: str, known_tools: set) -> bool:
+    def _looks_like_tool_explanation(response_text: str, known_tools: frozenset[str]) -> bool:
         """Détecte si la réponse ressemble à une explication de tool au lieu d'un appel.
 
         Signaux positifs (le modèle explique) :
@@ -990,32 +1360,23 @@ class ChatApp:
         if len(response_text) < 100:
             return False
 
-        # Signal fort : blocs JSON avec "name" (tentative de montrer un appel)
-        if re.search(r'```[a-z]*\s*\{[^}]*"name"\s*:', response_text, re.DOTALL):
-            return True
-
-        # Signal fort : JSON en ligne avec "name" + "arguments"
-        if re.search(r'"name"\s*:\s*"[a-z_]+"\s*,\s*"(arguments|parameters)"', response_text):
-            return True
-
-        # Signal fort : patterns JS de méthodes chaînées (hallucination de tools)
-        if re.search(r'\.(group_by|sort_by|filter_by|sum|count)\s*\(', response_text):
-            return True
-
-        # Signal moyen : nos tool names + verbe d'explication dans la même phrase
-        for tool_name in known_tools:
-            pattern = rf"(appel|utilis|invoke|call|use)[a-z]* .*{tool_name}|{tool_name}.*(appel|utilis|invoke|call|use)"
-            if re.search(pattern, response_text, re.IGNORECASE):
-                return True
-
-        return False
+        # Signaux forts (blocs/JSON avec "name", méthodes JS chaînées) et signal
+        # moyen (nos tool names + verbe d'explication dans la même phrase) : une
+        # seule regex, un seul parcours de la réponse
+        return _tool_explanation_re(known_tools).search(response_text) is not None
 
     async def _process_agent_loop(self) -> None:
         """Exécute la boucle agentique et affiche les résultats."""
         if not self.agent:
             return
 
-        start_time = time.time()  # Avant le try pour être accessible dans les except
+        from rich.live import Live
+        from rich.spinner import Spinner
+        from rich.style import Style
+        from rich.text import Text
+
+        # Horloge monotone (durées) ; avant le try pour être accessible dans les except
+        start_time = time.monotonic()
 
         try:
             # Message de début avec instruction d'annulation
@@ -1035,31 +1396,41 @@ class ChatApp:
                 "Le LLM traite les informations",
                 "Le LLM construit la réponse",
             ]
+            n_messages = len(friendly_messages)
             message_index = 0
-            last_message_change = time.time()
+            last_message_change = start_time
+            # Styles du texte du spinner, construits une fois (pas de markup à parser)
+            msg_style = Style(color="cyan")
+            stats_style = Style(dim=True)
+            total_style = Style(dim=True, bold=True)
 
             async def update_spinner():
                 """Met à jour le spinner avec messages sympathiques + vraies statistiques d'Ollama."""
                 nonlocal message_index, last_message_change
+                # Invariants de la requête, résolus une fois (le backend ne change pas
+                # pendant la boucle ; cumulative_usage est relu car remis à zéro au début)
+                backend = self.backend
+                monotonic = time.monotonic
                 while True:
-                    elapsed = time.time() - start_time
+                    now = monotonic()
+                    elapsed = now - start_time
 
                     # Changer de message toutes les 2 secondes
-                    if time.time() - last_message_change >= 2.0:
+                    if now - last_message_change >= 2.0:
                         message_index += 1
-                        last_message_change = time.time()
+                        last_message_change = now
 
                     # Message sympathique qui tourne
-                    friendly_msg = friendly_messages[message_index % len(friendly_messages)]
+                    friendly_msg = friendly_messages[message_index % n_messages]
 
                     # Construire le message avec les stats réelles
-                    if self.backend and hasattr(self.backend, 'cumulative_usage') and self.backend.cumulative_usage.get("api_calls", 0) > 0:
-                        cum = self.backend.cumulative_usage
-                        api_calls = cum.get("api_calls", 0)
-                        total_tok = cum.get("total_tokens", 0)
-                        last_stats = getattr(self.backend, 'last_usage', {}) or {}
-                        total_time = last_stats.get("total_duration_ms", 0)
-                        last_completion = last_stats.get("completion_tokens", 0)
+                    if backend is not None and backend.cumulative_usage.api_calls > 0:
+                        cum = backend.cumulative_usage
+                        api_calls = cum.api_calls
+                        total_tok = cum.total_tokens
+                        last_stats = backend.last_usage or CallUsage()
+                        total_time = last_stats.total_duration_ms
+                        last_completion = last_stats.completion_tokens
 
                         # Calculer les tokens/sec si on a des données Ollama
                         if total_time > 0 and last_completion > 0:
@@ -1070,23 +1441,37 @@ class ChatApp:
 
                         # Afficher le total cumulatif si plusieurs appels, sinon le dernier
                         if api_calls > 1:
-                            stats_text = (
-                                f"[dim]│ [bold]{total_tok:,}[/bold] tok ({api_calls} appels){tok_speed} │ {elapsed:.1f}s[/dim]"
+                            parts = (
+                                (f"{friendly_msg}...", msg_style),
+                                " ",
+                                ("│ ", stats_style),
+                                (f"{total_tok:,}", total_style),
+                                (
+                                    f" tok ({api_calls} appels){tok_speed} │ {elapsed:.1f}s",
+                                    stats_style,
+                                ),
                             )
                         else:
-                            last_prompt = last_stats.get("prompt_tokens", 0)
-                            last_compl = last_stats.get("completion_tokens", 0)
-                            stats_text = (
-                                f"[dim]│ {last_prompt}+{last_compl} tok{tok_speed} │ {elapsed:.1f}s[/dim]"
+                            last_prompt = last_stats.prompt_tokens
+                            last_compl = last_stats.completion_tokens
+                            parts = (
+                                (f"{friendly_msg}...", msg_style),
+                                " ",
+                                (
+                                    f"│ {last_prompt}+{last_compl} tok{tok_speed} │ {elapsed:.1f}s",
+                                    stats_style,
+                                ),
                             )
-
-                        msg = f"[cyan]{friendly_msg}...[/cyan] {stats_text}"
                     else:
                         # Pas encore de stats, afficher juste le message et le temps
-                        msg = f"[cyan]{friendly_msg}...[/cyan] [dim]│ {elapsed:.1f}s[/dim]"
+                        parts = (
+                            (f"{friendly_msg}...", msg_style),
+                            " ",
+                            (f"│ {elapsed:.1f}s", stats_style),
+                        )
 
-                    # Utiliser from_markup pour interpréter les balises Rich
-                    spinner.text = Text.from_markup(msg)
+                    # Segments stylés assemblés directement (sans Text.from_markup)
+                    spinner.text = Text.assemble(*parts)
                     await asyncio.sleep(0.5)  # Rafraîchir toutes les 0.5s
 
             # Lancer la mise à jour du spinner en arrière-plan
@@ -1123,13 +1508,12 @@ class ChatApp:
             self.messages = updated_messages
             new_count = len(self.messages)
 
-            # Sauvegarder les nouveaux messages dans la base de données
+            # Sauvegarder les nouveaux messages dans la base de données (en arrière-plan)
             if new_count > old_count:
-                for msg in self.messages[old_count:]:
-                    await self.db.save_message(msg)
+                self._db_queue.put_nowait(self.messages[old_count:])
 
             # Afficher les statistiques finales
-            self._display_token_stats(time.time() - start_time)
+            self._display_token_stats(time.monotonic() - start_time)
 
             # Afficher la réponse (si elle existe)
             if response:
@@ -1147,7 +1531,7 @@ class ChatApp:
                     )
 
                 # Détection passive : le modèle a-t-il expliqué des tools au lieu de les appeler ?
-                known_tools = {t.name for t in self.registry.list_tools()}
+                known_tools = self.registry.tool_names()
                 if self._looks_like_tool_explanation(response, known_tools):
                     self.console.print(
                         "\n[dim yellow]⚠ Le modèle semble avoir expliqué comment utiliser les "
@@ -1158,7 +1542,7 @@ class ChatApp:
 
         except KeyboardInterrupt:
             # Afficher les stats même en cas d'interruption
-            self._display_token_stats(time.time() - start_time)
+            self._display_token_stats(time.monotonic() - start_time)
             # Message d'annulation très visible
             self.console.print("\n")
             self.console.print("[bold red on black] ✗ ANNULÉ - Traitement interrompu (Ctrl+C) [/bold red on black]")
@@ -1166,7 +1550,7 @@ class ChatApp:
             logger.info("Request cancelled by user with Ctrl+C")
         except BackendError as e:
             # Afficher les stats avant le message d'erreur
-            self._display_token_stats(time.time() - start_time)
+            self._display_token_stats(time.monotonic() - start_time)
             error_msg = str(e)
 
             if e.error_type == BackendError.RATE_LIMIT:
@@ -1202,15 +1586,13 @@ class ChatApp:
                 )
 
             elif e.error_type == BackendError.MODEL_NOT_FOUND:
-                error_display = error_msg.replace("[", "\\[").replace("]", "\\]")
+                error_display = _escape_markup(error_msg)
                 self.console.print(
                     f"\n[bold yellow]⚠ Modèle introuvable:[/bold yellow] {error_display}\n"
-                    "[bold yellow]⚠ Le modèle semble invalide.[/bold yellow]\n"
-                    "[dim]Voulez-vous choisir un autre modèle ? (y/n)[/dim] ",
-                    end="",
+                    "[bold yellow]⚠ Le modèle semble invalide.[/bold yellow]"
                 )
                 try:
-                    choice = input().strip().lower()
+                    choice = (await self._ask("Voulez-vous choisir un autre modèle ? (y/n) ")).lower()
                     if choice in ["y", "yes", "o", "oui"]:
                         if await self._verify_model():
                             self.console.print(
@@ -1241,16 +1623,16 @@ class ChatApp:
                     return
 
                 # Erreur générique non catégorisée
-                error_display = error_msg.replace("[", "\\[").replace("]", "\\]")
+                error_display = _escape_markup(error_msg)
                 self.console.print(f"\n[bold red]Erreur:[/bold red] {error_display}")
                 logger.error(f"Backend error in agent loop: {e}", exc_info=True)
                 self.console.print("[dim]→ Vous pouvez continuer avec une nouvelle commande[/dim]\n")
 
         except Exception as e:
             # Afficher les stats avant le message d'erreur
-            self._display_token_stats(time.time() - start_time)
+            self._display_token_stats(time.monotonic() - start_time)
             # Échapper le message d'erreur pour éviter les conflits de markup
-            error_display = str(e).replace("[", "\\[").replace("]", "\\]")
+            error_display = _escape_markup(str(e))
             self.console.print(f"\n[bold red]Erreur:[/bold red] {error_display}")
             self.console.print("[dim]→ Vous pouvez continuer avec une nouvelle commande[/dim]\n")
             logger.error(f"Error in agent loop: {e}", exc_info=True)
@@ -1281,12 +1663,22 @@ class ChatApp:
         if not self.prompt_manager.show_info_bar:
             return ""
 
+        # Réutiliser le texte tant que rien de ce qu'il affiche n'a changé
+        state = (
+            self.debug_mode,
+            self.confirmation_manager.mode if self.confirmation_manager else None,
+            self.config.default_backend,
+            self.backend.model if self.backend else None,
+        )
+        cached = self._toolbar_cache
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
         # Préparer les informations
         parts = []
 
         # Workspace (nom court)
-        workspace_name = Path.cwd().name if Path.cwd().name else "/"
-        parts.append(f"{workspace_name}")
+        parts.append(self._workspace_name)
 
         # Mode d'édition
         parts.append("Enter=send Ctrl+J/Alt+Enter=newline")
@@ -1304,29 +1696,15 @@ class ChatApp:
         if self.backend:
             backend_config = self.config.backends[self.config.default_backend]
             backend_type = backend_config.type
-            model = self.backend.model
-
             # Raccourcir le nom du modèle si trop long (prioriser la FIN qui est plus précise)
-            model_short = model.split(":")[0] if ":" in model else model
-            max_len = 40  # Limite raisonnable pour la barre
-
-            if len(model_short) > max_len:
-                # Garder le préfixe (provider) et la fin (version précise)
-                if "/" in model_short:
-                    provider = model_short.split("/")[0]
-                    # Calculer combien de caractères on peut garder pour la fin
-                    remaining = max_len - len(provider) - 4  # -4 pour "/..."
-                    suffix = model_short[-remaining:] if remaining > 0 else model_short[-10:]
-                    model_short = f"{provider}/...{suffix}"
-                else:
-                    # Pas de provider, juste garder la fin
-                    model_short = "..." + model_short[-(max_len-3):]
+            model_short = _shorten_model(self.backend.model)
 
             parts.append(f"{backend_type}:{model_short}")
 
         # Créer la ligne d'information avec séparateurs
         info_line = " │ ".join(parts)
 
+        self._toolbar_cache = (state, info_line)
         return info_line
 
     def _show_help(self, command: str = "/help") -> None:
@@ -1399,6 +1777,8 @@ Tapez `/help <topic>` pour plus d'informations :
 
 💡 **Astuce:** Tapez `/help config` pour la gestion des backends et modèles !
 """
+        from rich.markdown import Markdown
+
         self.console.print(Markdown(help_text))
 
     def _show_topic_help(self, topic: str) -> None:
@@ -1644,6 +2024,7 @@ Utilisez `nano ~/.agentichat/config.yaml` pour éditer.
 ## Commandes
 
 - `/albert list` - Liste tous les modèles disponibles
+- `/albert refresh` - Recharge la liste des modèles (vide le cache)
 - `/albert show <model>` - Informations détaillées d'un modèle
 - `/albert run <model>` - Change de modèle Albert
 - `/albert usage` - Statistiques d'utilisation (tokens, requêtes, coûts)
@@ -1731,7 +2112,7 @@ Le LLM a accès à ces outils pour interagir avec votre système :
 
 ### /save
 Sauvegarde la discussion actuelle dans un fichier.
-- Fichier : `.agentichat/conversation.pkl`
+- Fichier : `.agentichat/conversation.jsonl`
 - Sauvegarde tous les messages (utilisateur, assistant, système, tools)
 - Permet de reprendre la conversation plus tard
 
@@ -1802,11 +2183,11 @@ Récupération de la discussion (15 messages, ~12.3 KB)
 
 ## Fichier de Sauvegarde
 
-**Emplacement :** `.agentichat/conversation.pkl`
+**Emplacement :** `.agentichat/conversation.jsonl`
 
-**Format :** Pickle Python (binaire)
+**Format :** JSON Lines (un message JSON par ligne)
 
-**Contenu :** Liste complète des messages (Message objects)
+**Contenu :** Liste complète des messages (rôle, contenu, tool calls)
 
 ## Notes
 
@@ -2038,6 +2419,8 @@ La plupart des modèles Albert supportent nativement les tool calls.
         }
 
         if topic in topics:
+            from rich.markdown import Markdown
+
             self.console.print(Markdown(topics[topic]))
         else:
             self.console.print(
@@ -2369,9 +2752,16 @@ La plupart des modèles Albert supportent nativement les tool calls.
                     f"Using saved max_parallel_tools={saved_limit} for model '{backend_config.model}'"
                 )
 
+        # Fermer la session HTTP du gestionnaire Albert remplacé
+        if self.albert_manager:
+            await self.albert_manager.close()
+
         # Instancier le nouveau backend
         try:
             if backend_config.type == "ollama":
+                from ..backends.ollama import OllamaBackend
+                from .ollama_manager import OllamaManager
+
                 self.backend = OllamaBackend(
                     url=backend_config.url,
                     model=backend_config.model,
@@ -2379,6 +2769,10 @@ La plupart des modèles Albert supportent nativement les tool calls.
                     max_tokens=backend_config.max_tokens,
                     temperature=backend_config.temperature,
                     max_parallel_tools=max_parallel_tools,
+                    connector_limit=backend_config.connector_limit,
+                    connector_limit_per_host=backend_config.connector_limit_per_host,
+                    max_parallel_requests=backend_config.max_parallel_requests,
+                    transport=backend_config.transport,
                 )
                 # Initialiser le gestionnaire Ollama
                 self.ollama_manager = OllamaManager(
@@ -2387,6 +2781,9 @@ La plupart des modèles Albert supportent nativement les tool calls.
                 self.albert_manager = None
 
             elif backend_config.type == "albert":
+                from ..backends.albert import AlbertBackend
+                from .albert_manager import AlbertManager
+
                 self.backend = AlbertBackend(
                     url=backend_config.url,
                     model=backend_config.model,
@@ -2395,28 +2792,24 @@ La plupart des modèles Albert supportent nativement les tool calls.
                     max_tokens=backend_config.max_tokens,
                     temperature=backend_config.temperature,
                     max_parallel_tools=max_parallel_tools,
+                    connector_limit=backend_config.connector_limit,
+                    connector_limit_per_host=backend_config.connector_limit_per_host,
+                    max_parallel_requests=backend_config.max_parallel_requests,
                 )
                 # Initialiser le gestionnaire Albert
                 self.albert_manager = AlbertManager(
                     url=backend_config.url,
                     api_key=backend_config.api_key,
                     timeout=backend_config.timeout,
+                    transport=backend_config.transport,
                 )
+                self.albert_manager.start_warmup()  # Connexion ouverte en arrière-plan
                 self.ollama_manager = None
 
                 # Ajouter les tools Albert
                 if self.registry:
-                    self.registry.register(
-                        AlbertSearchTool(backend_config.url, backend_config.api_key)
-                    )
-                    self.registry.register(
-                        AlbertOCRTool(backend_config.url, backend_config.api_key)
-                    )
-                    self.registry.register(
-                        AlbertTranscriptionTool(backend_config.url, backend_config.api_key)
-                    )
-                    self.registry.register(
-                        AlbertEmbeddingsTool(backend_config.url, backend_config.api_key)
+                    self.registry.register_many(
+                        self._create_albert_tools(backend_config.url, backend_config.api_key)
                     )
                     logger.debug("Added 4 Albert tools")
 
@@ -2461,7 +2854,7 @@ La plupart des modèles Albert supportent nativement les tool calls.
             )
 
         # Afficher le résultat
-        tools_count = len(self.registry.list_tools()) if self.registry else 0
+        tools_count = len(self.registry.tool_names()) if self.registry else 0
         self.console.print(
             f"[bold green]✓[/bold green] Backend changé: {old_backend} → {backend_name}\n"
             f"[dim]Type: {backend_config.type}, Modèle: {backend_config.model}[/dim]\n"
@@ -2481,15 +2874,14 @@ La plupart des modèles Albert supportent nativement les tool calls.
         self.debug_mode = enabled
         level = logging.DEBUG if enabled else logging.INFO
 
-        # Mettre à jour tous les loggers
-        for logger_name in ["agentichat", "agentichat.cli", "agentichat.backends.ollama", "agentichat.core.agent"]:
-            logger_instance = logging.getLogger(logger_name)
-            logger_instance.setLevel(level)
+        # Mettre à jour le logger racine (les loggers "agentichat.*" en héritent)
+        logger_instance = logging.getLogger("agentichat")
+        logger_instance.setLevel(level)
 
-            # Mettre à jour le niveau des handlers console (si présents)
-            for handler in logger_instance.handlers:
-                if isinstance(handler, logging.StreamHandler) and handler.stream.name == '<stderr>':
-                    handler.setLevel(level)
+        # Mettre à jour le niveau des handlers console (si présents)
+        for handler in logger_instance.handlers:
+            if isinstance(handler, logging.StreamHandler) and handler.stream.name == '<stderr>':
+                handler.setLevel(level)
 
         log_file = self.config.data_dir / "agentichat.log"
         logger.info(f"Debug mode {'enabled' if enabled else 'disabled'} dynamically")
@@ -2779,6 +3171,9 @@ La plupart des modèles Albert supportent nativement les tool calls.
                     return
 
                 # Changer le modèle du backend
+                from ..backends.albert import AlbertBackend
+                from ..backends.ollama import OllamaBackend
+
                 if isinstance(self.backend, (OllamaBackend, AlbertBackend)):
                     old_model = self.backend.model
                     self.backend.set_model(model_name)
@@ -2892,7 +3287,7 @@ La plupart des modèles Albert supportent nativement les tool calls.
 
         except Exception as e:
             # Échapper le message d'erreur pour éviter les conflits de markup
-            error_display = str(e).replace("[", "\\[").replace("]", "\\]")
+            error_display = _escape_markup(str(e))
             self.console.print(f"\n[bold red]Erreur:[/bold red] {error_display}\n")
             logger.error(f"Ollama command error: {e}", exc_info=True)
 
@@ -2916,6 +3311,7 @@ La plupart des modèles Albert supportent nativement les tool calls.
             self.console.print(
                 "[bold yellow]Commandes /albert disponibles:[/bold yellow]\n"
                 "  /albert list            - Liste tous les modèles disponibles\n"
+                "  /albert refresh         - Recharge la liste des modèles (vide le cache)\n"
                 "  /albert show <model>    - Informations détaillées d'un modèle\n"
                 "  /albert run <model>     - Change de modèle\n"
                 "  /albert usage           - Affiche vos statistiques d'utilisation\n"
@@ -2926,7 +3322,10 @@ La plupart des modèles Albert supportent nativement les tool calls.
         subcommand = parts[1].lower()
 
         try:
-            if subcommand == "list":
+            if subcommand in ("list", "refresh"):
+                if subcommand == "refresh":
+                    # Ignorer les caches (mémoire et disque) de la liste des modèles
+                    await self.albert_manager.invalidate_cache()
                 # Lister les modèles
                 models = await self.albert_manager.list_models()
                 if not models:
@@ -3014,6 +3413,8 @@ La plupart des modèles Albert supportent nativement les tool calls.
                     return
 
                 # Changer le modèle du backend
+                from ..backends.albert import AlbertBackend
+
                 if isinstance(self.backend, AlbertBackend):
                     old_model = self.backend.model
                     self.backend.set_model(model_id)
@@ -3068,7 +3469,7 @@ La plupart des modèles Albert supportent nativement les tool calls.
 
         except Exception as e:
             # Échapper le message d'erreur pour éviter les conflits de markup
-            error_display = str(e).replace("[", "\\[").replace("]", "\\]")
+            error_display = _escape_markup(str(e))
             self.console.print(f"\n[bold red]Erreur:[/bold red] {error_display}\n")
             logger.error(f"Albert command error: {e}", exc_info=True)
 
@@ -3149,6 +3550,7 @@ La plupart des modèles Albert supportent nativement les tool calls.
 
     async def _handle_info_command(self) -> None:
         """Affiche les informations sur la session et la conversation en cours."""
+        await self._db_queue.join()  # Statistiques à jour des messages en attente
         stats = await self.db.get_session_stats()
 
         if not stats:
@@ -3264,7 +3666,7 @@ La plupart des modèles Albert supportent nativement les tool calls.
 
         # Statistiques avant compression
         original_count = len(self.messages)
-        original_chars = sum(len(msg.content or "") for msg in self.messages)
+        original_chars = sum(len(msg.content) for msg in self.messages)
 
         # Déterminer quels messages compresser
         if keep_messages and keep_messages < len(self.messages):
@@ -3319,7 +3721,7 @@ Résumé structuré:"""
 
             # Statistiques après compression
             compressed_count = len(self.messages)
-            compressed_chars = sum(len(msg.content or "") for msg in self.messages)
+            compressed_chars = sum(len(msg.content) for msg in self.messages)
 
             # Sauvegarder la compression dans la DB
             await self.db.save_compression(
@@ -3352,7 +3754,7 @@ Résumé structuré:"""
 
         except Exception as e:
             # Échapper le message d'erreur pour éviter les conflits de markup
-            error_display = str(e).replace("[", "\\[").replace("]", "\\]")
+            error_display = _escape_markup(str(e))
             self.console.print(f"[red]Erreur lors de la compression: {error_display}[/red]\n")
             logger.error(f"Compression error: {e}", exc_info=True)
 
@@ -3396,11 +3798,9 @@ Résumé structuré:"""
 
             # Demander si on veut ré-injecter dans la conversation
             self.console.print()
-            self.console.print(
-                "[dim]Voulez-vous charger ces consignes dans la conversation actuelle ? (Y/n):[/dim] ",
-                end=""
+            response = await self._ask(
+                "Voulez-vous charger ces consignes dans la conversation actuelle ? (Y/n): "
             )
-            response = input().strip()
 
             if response.lower() not in ["n", "no", "non"]:
                 await self._inject_guidelines()
@@ -3409,7 +3809,7 @@ Résumé structuré:"""
                 self.console.print("[dim]Les consignes seront utilisées au prochain démarrage[/dim]\n")
 
         except Exception as e:
-            error_display = str(e).replace("[", "\\[").replace("]", "\\]")
+            error_display = _escape_markup(str(e))
             self.console.print(
                 f"[bold red]Erreur lors de la compilation:[/bold red] {error_display}\n"
             )
@@ -3459,7 +3859,7 @@ Résumé structuré:"""
             self.console.print("[red]Erreur: Timeout (30s dépassé)[/red]\n")
         except Exception as e:
             # Échapper le message d'erreur pour éviter les conflits de markup
-            error_display = str(e).replace("[", "\\[").replace("]", "\\]")
+            error_display = _escape_markup(str(e))
             self.console.print(f"[red]Erreur: {error_display}[/red]\n")
 
         self.console.print()
@@ -3477,7 +3877,7 @@ Résumé structuré:"""
             # Chercher le message de résumé
             summary_msg = None
             for msg in self.messages:
-                if msg.role == "system" and "[Résumé de la conversation précédente]" in (msg.content or ""):
+                if msg.role == "system" and "[Résumé de la conversation précédente]" in msg.content:
                     summary_msg = msg
                     break
 
@@ -3515,7 +3915,7 @@ Résumé structuré:"""
             self.console.print(f"[dim]{i}.[/dim] {role_label}")
 
             # Limiter l'affichage si le message est très long
-            content = msg.content or ""
+            content = msg.content
             if len(content) > 500:
                 preview = content[:500] + "..."
                 self.console.print(f"[dim]{preview}[/dim]")
@@ -3525,7 +3925,7 @@ Résumé structuré:"""
             self.console.print()  # Ligne vide entre les messages
 
         # Statistiques
-        total_chars = sum(len(m.content or "") for m in self.messages)
+        total_chars = sum(len(m.content) for m in self.messages)
         self.console.print(
             f"[dim]Total: {len(self.messages)} messages, "
             f"~{total_chars:,} caractères (~{total_chars / 1024:.1f} KB)[/dim]\n"
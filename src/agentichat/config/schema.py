@@ -18,6 +18,13 @@ class BackendConfig:
     api_key: str | None = None
     max_parallel_tools: int | None = None  # None = illimité, 1 = un seul à la fois
     context_max_tokens: int | None = None  # Limite de contexte en entrée (None = pas de limite)
+    connector_limit: int = 1024  # Connexions HTTP simultanées max (pool aiohttp)
+    connector_limit_per_host: int = 256  # Connexions HTTP simultanées max par hôte
+    max_parallel_requests: int = 32  # Requêtes chat simultanées max sur ce backend
+    # Client HTTP, "aiohttp" ou "httpx" : lu par le backend Ollama (requêtes de chat)
+    # et par les commandes /albert, pas par le backend Albert. httpx ne négocie
+    # HTTP/2 que si l'URL est en https
+    transport: str = "aiohttp"
 
 
 @dataclass
@@ -159,6 +166,10 @@ def validate_config(config: dict[str, Any]) -> Config:
             api_key=backend_data.get("api_key"),
             max_parallel_tools=backend_data.get("max_parallel_tools"),
             context_max_tokens=backend_data.get("context_max_tokens"),
+            connector_limit=backend_data.get("connector_limit", 1024),
+            connector_limit_per_host=backend_data.get("connector_limit_per_host", 256),
+            max_parallel_requests=backend_data.get("max_parallel_requests", 32),
+            transport=backend_data.get("transport", "aiohttp"),
         )
 
     # Vérifier que le backend par défaut existe
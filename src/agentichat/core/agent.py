@@ -1,6 +1,7 @@
 """Boucle agentique pour gérer les tool calls."""
 
 import json
+from dataclasses import replace
 from typing import Any, Callable
 
 from ..backends.base import Backend, Message, ToolCall
@@ -75,7 +76,7 @@ class AgentLoop:
                     "demande de reformulation plus concise"
                 )
                 messages.append(
-                    Message(role="assistant", content=response.content or "")
+                    Message(role="assistant", content=response.content)
                 )
                 messages.append(
                     Message(
@@ -98,14 +99,24 @@ class AgentLoop:
             messages.append(
                 Message(
                     role="assistant",
-                    content=response.content or "",
+                    content=response.content,
                     tool_calls=response.tool_calls,
                 )
             )
 
-            # Exécuter chaque tool call
-            for tool_call in response.tool_calls:
-                result = await self._execute_tool_call(tool_call)
+            # Exécuter les tool calls dans l'ordre (seuls les tools en lecture seule
+            # consécutifs sont parallélisés ; résultats dans l'ordre des appels)
+            results = await self.backend.execute_tool_calls(
+                response.tool_calls,
+                self._execute_tool_call,
+                can_run_parallel=self._is_parallel_safe,
+            )
+            for tool_call, result in zip(response.tool_calls, results):
+                if isinstance(result, BaseException):
+                    result = {
+                        "success": False,
+                        "error": f"Erreur lors de l'exécution: {result}",
+                    }
                 result = self._truncate_tool_result(result)
 
                 # Ajouter le résultat à l'historique
@@ -208,19 +219,21 @@ class AgentLoop:
         if self.backend.estimate_messages_tokens(messages) <= budget:
             return messages
 
-        # Travailler sur une copie pour ne pas altérer l'historique original
-        import copy
-        working = copy.deepcopy(messages)
-
-        # Phase 1 : Tronquer les tool results volumineux
-        for msg in working:
-            if msg.role == "tool" and len(msg.content or "") > 2000:
+        # Phase 1 : Tronquer les tool results volumineux. Les messages sont figés :
+        # les résultats tronqués sont des copies, l'historique original est intact
+        working = []
+        for msg in messages:
+            if msg.role == "tool" and len(msg.content) > 2000:
                 content = msg.content
-                msg.content = (
-                    content[:500]
-                    + f"\n\n[... {len(content) - 1000} caractères omis ...]\n\n"
-                    + content[-500:]
+                msg = replace(
+                    msg,
+                    content=(
+                        content[:500]
+                        + f"\n\n[... {len(content) - 1000} caractères omis ...]\n\n"
+                        + content[-500:]
+                    ),
                 )
+            working.append(msg)
 
         if self.backend.estimate_messages_tokens(working) <= budget:
             return working
@@ -268,6 +281,18 @@ class AgentLoop:
 
         return result
 
+    def _is_parallel_safe(self, tool_call: ToolCall) -> bool:
+        """Indique si un tool call peut s'exécuter en parallèle de ses voisins.
+
+        Args:
+            tool_call: Tool call à examiner
+
+        Returns:
+            True pour un tool en lecture seule ne demandant pas de confirmation
+        """
+        tool = self.registry.get(tool_call.name)
+        return tool is not None and tool.read_only and not tool.requires_confirmation
+
     async def _execute_tool_call(self, tool_call: ToolCall) -> dict[str, Any]:
         """Exécute un tool call avec confirmation si nécessaire.
 
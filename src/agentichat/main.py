@@ -5,7 +5,6 @@ from pathlib import Path
 
 import click
 
-from .cli.app import run_chat
 from .config.loader import load_config, save_config
 from .config.schema import Config
 
@@ -89,6 +88,8 @@ def cli(ctx: click.Context, config: Path | None, init: bool, force: bool) -> Non
 
     # Si aucune sous-commande n'est spécifiée, lancer le mode interactif
     if ctx.invoked_subcommand is None:
+        from .cli.app import run_chat  # Import lourd, évité pour les sous-commandes
+
         asyncio.run(run_chat(config))
 
 
@@ -167,6 +168,8 @@ def config_show(config: Path | None) -> None:
 )
 def chat(config: Path | None) -> None:
     """Lance le mode chat interactif."""
+    from .cli.app import run_chat
+
     asyncio.run(run_chat(config))
 
 
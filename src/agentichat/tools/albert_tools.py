@@ -12,6 +12,8 @@ logger = get_logger("agentichat.tools.albert")
 class AlbertSearchTool(Tool):
     """Tool pour rechercher dans des collections de documents via Albert API."""
 
+    read_only = True
+
     def __init__(self, api_url: str, api_key: str) -> None:
         """Initialise le tool de recherche Albert.
 
@@ -134,6 +136,8 @@ class AlbertSearchTool(Tool):
 class AlbertOCRTool(Tool):
     """Tool pour extraire du texte depuis des images/PDF via Albert API."""
 
+    read_only = True
+
     def __init__(self, api_url: str, api_key: str) -> None:
         """Initialise le tool OCR Albert.
 
@@ -232,6 +236,8 @@ class AlbertOCRTool(Tool):
 class AlbertTranscriptionTool(Tool):
     """Tool pour transcrire de l'audio en texte via Albert API."""
 
+    read_only = True
+
     def __init__(self, api_url: str, api_key: str) -> None:
         """Initialise le tool de transcription Albert.
 
@@ -338,6 +344,8 @@ class AlbertTranscriptionTool(Tool):
 class AlbertEmbeddingsTool(Tool):
     """Tool pour créer des embeddings (vecteurs) de texte via Albert API."""
 
+    read_only = True
+
     def __init__(self, api_url: str, api_key: str) -> None:
         """Initialise le tool d'embeddings Albert.
 
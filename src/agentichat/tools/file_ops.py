@@ -11,6 +11,8 @@ from .registry import Tool
 class ListFilesTool(Tool):
     """Tool pour lister les fichiers d'un répertoire."""
 
+    read_only = True
+
     def __init__(self, sandbox: Sandbox) -> None:
         """Initialise le tool.
 
@@ -101,6 +103,8 @@ class ListFilesTool(Tool):
 class ReadFileTool(Tool):
     """Tool pour lire le contenu d'un fichier."""
 
+    read_only = True
+
     def __init__(self, sandbox: Sandbox) -> None:
         """Initialise le tool.
 
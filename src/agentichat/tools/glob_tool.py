@@ -10,6 +10,8 @@ from .registry import Tool
 class GlobTool(Tool):
     """Tool pour rechercher des fichiers avec des patterns glob."""
 
+    read_only = True
+
     def __init__(self, sandbox: Sandbox) -> None:
         """Initialise le tool.
 
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar, Iterable
 
 
 @dataclass
@@ -13,6 +13,9 @@ class Tool(ABC):
     description: str
     parameters: dict  # JSON Schema
     requires_confirmation: bool = False
+    # True si le tool n'a aucun effet de bord (lecture seule) : ses appels
+    # consécutifs d'une même réponse peuvent s'exécuter en parallèle
+    read_only: ClassVar[bool] = False
 
     @abstractmethod
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
@@ -48,7 +51,14 @@ class ToolRegistry:
     def __init__(self) -> None:
         """Initialise le registre vide."""
         self._tools: dict[str, Tool] = {}
-        self._schemas_cache: list[dict] | None = None  # Invalidé à chaque register()
+        # Caches invalidés à chaque register()
+        self._schemas_cache: list[dict] | None = None
+        self._names_cache: frozenset[str] | None = None
+
+    def _invalidate(self) -> None:
+        """Signale une modification du registre (caches à recalculer)."""
+        self._schemas_cache = None
+        self._names_cache = None
 
     def register(self, tool: Tool) -> None:
         """Enregistre un tool.
@@ -57,7 +67,16 @@ class ToolRegistry:
             tool: Tool à enregistrer
         """
         self._tools[tool.name] = tool
-        self._schemas_cache = None  # Invalider le cache
+        self._invalidate()
+
+    def register_many(self, tools: Iterable[Tool]) -> None:
+        """Enregistre plusieurs tools en une seule mise à jour du registre.
+
+        Args:
+            tools: Tools à enregistrer
+        """
+        self._tools.update((tool.name, tool) for tool in tools)
+        self._invalidate()
 
     def get(self, name: str) -> Tool | None:
         """Récupère un tool par son nom.
@@ -78,6 +97,18 @@ class ToolRegistry:
         """
         return list(self._tools.values())
 
+    def tool_names(self) -> frozenset[str]:
+        """Retourne les noms des tools enregistrés.
+
+        Le résultat est mis en cache et recalculé uniquement après un register().
+
+        Returns:
+            Ensemble (immuable) des noms
+        """
+        if self._names_cache is None:
+            self._names_cache = frozenset(self._tools)
+        return self._names_cache
+
     def to_schemas(self) -> list[dict[str, Any]]:
         """Convertit tous les tools en schémas JSON.
 
@@ -11,6 +11,8 @@ from .registry import Tool
 class SearchTextTool(Tool):
     """Tool pour rechercher du texte dans les fichiers (grep-like)."""
 
+    read_only = True
+
     def __init__(self, sandbox: Sandbox) -> None:
         """Initialise le tool.
 
@@ -11,6 +11,8 @@ from .registry import Tool
 class WebFetchTool(Tool):
     """Tool pour récupérer du contenu depuis une URL."""
 
+    read_only = True
+
     def __init__(self) -> None:
         """Initialise le tool."""
         super().__init__(
@@ -88,6 +90,8 @@ class WebFetchTool(Tool):
 class WebSearchTool(Tool):
     """Tool pour rechercher sur le web."""
 
+    read_only = True
+
     def __init__(self) -> None:
         """Initialise le tool."""
         super().__init__(
@@ -15,6 +15,11 @@ from .logger import get_logger
 
 logger = get_logger("agentichat.utils.database")
 
+_INSERT_MESSAGE_SQL = """
+    INSERT INTO messages (session_id, role, content, tool_calls, created_at, token_count)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
 class DatabaseManager:
     """Gestionnaire de base de données SQLite pour agentichat."""
@@ -128,25 +133,9 @@ class DatabaseManager:
 
         now = time.time()
 
-        # Sérialiser les tool_calls si présents
-        tool_calls_json = None
-        if hasattr(message, "tool_calls") and message.tool_calls:
-            tool_calls_json = json.dumps([asdict(tc) for tc in message.tool_calls])
-
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute(
-                """
-                INSERT INTO messages (session_id, role, content, tool_calls, created_at, token_count)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    self.session_id,
-                    message.role,
-                    message.content or "",
-                    tool_calls_json,
-                    now,
-                    token_count,
-                ),
+                _INSERT_MESSAGE_SQL, self._message_row(message, now, token_count)
             )
 
             # Mettre à jour le timestamp de la session
@@ -157,6 +146,61 @@ class DatabaseManager:
 
             await db.commit()
 
+    async def save_messages(self, messages: list[Message]) -> None:
+        """Sauvegarde plusieurs messages dans une seule transaction.
+
+        Args:
+            messages: Messages à sauvegarder, dans l'ordre de la conversation
+        """
+        if not self.session_id:
+            logger.warning("No active session, cannot save messages")
+            return
+        if not messages:
+            return
+
+        now = time.time()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                _INSERT_MESSAGE_SQL,
+                [self._message_row(message, now) for message in messages],
+            )
+
+            # Mettre à jour le timestamp de la session
+            await db.execute(
+                "UPDATE sessions SET updated_at = ? WHERE id = ?",
+                (now, self.session_id),
+            )
+
+            await db.commit()
+
+    def _message_row(
+        self, message: Message, now: float, token_count: int | None = None
+    ) -> tuple:
+        """Construit la ligne de la table messages correspondant à un message.
+
+        Args:
+            message: Message à sauvegarder
+            now: Horodatage de l'insertion
+            token_count: Nombre de tokens (optionnel)
+
+        Returns:
+            Valeurs pour _INSERT_MESSAGE_SQL
+        """
+        # Sérialiser les tool_calls si présents
+        tool_calls_json = None
+        if message.tool_calls:
+            tool_calls_json = json.dumps([asdict(tc) for tc in message.tool_calls])
+
+        return (
+            self.session_id,
+            message.role,
+            message.content,
+            tool_calls_json,
+            now,
+            token_count,
+        )
+
     async def get_session_messages(self, session_id: str | None = None) -> list[Message]:
         """Récupère tous les messages d'une session.
 
@@ -177,7 +221,7 @@ class DatabaseManager:
                 SELECT role, content, tool_calls
                 FROM messages
                 WHERE session_id = ?
-                ORDER BY created_at ASC
+                ORDER BY created_at ASC, id ASC
                 """,
                 (sid,),
             ) as cursor:
@@ -8,6 +8,9 @@ from ..utils.logger import get_logger
 
 logger = get_logger("agentichat.utils.guidelines")
 
+# Début du contenu du message système des consignes (permet de le reconnaître)
+GUIDELINES_TAG = "[User Project Guidelines]"
+
 
 class GuidelinesManager:
     """Gestionnaire des consignes utilisateur."""
@@ -173,7 +176,7 @@ Now generate the optimized guidelines (in English, structured, concise):"""
             compiled_content = self.read_compiled()
             return Message(
                 role="system",
-                content=f"[User Project Guidelines]\n\n{compiled_content}\n\n[End of Guidelines]"
+                content=f"{GUIDELINES_TAG}\n\n{compiled_content}\n\n[End of Guidelines]"
             )
         except Exception as e:
             logger.error(f"Error reading compiled guidelines: {e}")
@@ -0,0 +1,69 @@
+"""Sérialisation JSON rapide pour les chemins critiques (requêtes/réponses LLM).
+
+Utilise orjson s'il est installé (extra ``perf``), sinon la bibliothèque
+standard. Les deux implémentations acceptent ``str`` ou ``bytes`` en entrée
+et lèvent ``json.JSONDecodeError`` (ou une sous-classe) en cas d'erreur.
+
+Le module ``simdjson`` (pysimdjson) est aussi exposé s'il est installé, pour
+les parsers réutilisables du streaming ; il vaut ``None`` sinon.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Dépendance optionnelle
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # Dépendance optionnelle
+    simdjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """Désérialise un document JSON.
+
+    Args:
+        data: Document JSON (str ou bytes UTF-8)
+
+    Returns:
+        Objet Python correspondant
+
+    Raises:
+        JSONDecodeError: Si le document est invalide
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Sérialise un objet en JSON compact encodé en UTF-8.
+
+    Args:
+        obj: Objet à sérialiser
+
+    Returns:
+        Document JSON en bytes, prêt à être envoyé comme corps HTTP
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Sérialise un objet en JSON compact.
+
+    Args:
+        obj: Objet à sérialiser
+
+    Returns:
+        Document JSON en str
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -1,6 +1,8 @@
 """Sandbox de sécurité pour l'exécution des tools."""
 
 import fnmatch
+import os
+import re
 from pathlib import Path
 
 
@@ -23,7 +25,7 @@ class Sandbox:
         self.root = root.resolve()
         config = config or {}
         self.max_file_size = config.get("max_file_size", 1_000_000)
-        self.blocked_patterns = config.get(
+        self.blocked_patterns = tuple(config.get(
             "blocked_paths",
             [
                 "**/.env",
@@ -33,8 +35,8 @@ class Sandbox:
                 "**/credentials.json",
                 "**/.ssh/*",
             ],
-        )
-        self.ignored_patterns = config.get(
+        ))
+        self.ignored_patterns = tuple(config.get(
             "ignored_paths",
             [
                 "**/.venv/**", "**/venv/**", "**/env/**",
@@ -43,6 +45,26 @@ class Sandbox:
                 "**/__pycache__/**",
                 "**/build/**", "**/dist/**", "**/*.egg-info/**",
             ],
+        ))
+
+        # should_ignore est appelé pour chaque fichier parcouru : les patterns
+        # ignorés sont compilés une fois en une regex unique (équivalent fnmatch)
+        # et un ensemble de noms de répertoires (patterns **/nom/**)
+        self._ignored_re = (
+            re.compile(
+                "|".join(
+                    fnmatch.translate(os.path.normcase(p)) for p in self.ignored_patterns
+                )
+            )
+            if self.ignored_patterns
+            else None
+        )
+        self._ignored_dir_names = frozenset(
+            part
+            for pattern in self.ignored_patterns
+            if "**" in pattern
+            for part in pattern.split("/")
+            if part and part != "**" and not part.startswith("*")
         )
 
     def validate_path(self, path: str) -> Path:
@@ -155,24 +177,12 @@ class Sandbox:
             # Chemin hors du workspace, ne pas ignorer (sera bloqué par validate_path)
             return False
 
-        # Convertir en string pour fnmatch
-        rel_path_str = str(rel_path)
-
-        # Vérifier les patterns ignorés
-        for pattern in self.ignored_patterns:
-            # Approche 1: fnmatch direct (pour patterns simples)
-            if fnmatch.fnmatch(rel_path_str, pattern):
-                return True
-
-            # Approche 2: Vérifier si le pattern contient ** et l'adapter
-            # Extraire le nom du répertoire à ignorer du pattern (ex: **/.venv/** → .venv)
-            if "**" in pattern:
-                # Pattern type: **/.venv/** ou **/node_modules/**
-                parts = pattern.split("/")
-                for part in parts:
-                    if part and part != "**" and not part.startswith("*"):
-                        # Vérifier si ce nom de répertoire apparaît dans le chemin
-                        if part in rel_path.parts:
-                            return True
-
-        return False
+        # Approche 1: fnmatch direct (pour patterns simples)
+        if self._ignored_re is not None and self._ignored_re.match(
+            os.path.normcase(str(rel_path))
+        ):
+            return True
+
+        # Approche 2: un nom de répertoire extrait d'un pattern ** (ex: **/.venv/** → .venv)
+        # apparaît dans le chemin
+        return not self._ignored_dir_names.isdisjoint(rel_path.parts)